@@ -3,55 +3,40 @@
 Deep control flow analysis of Unix V4 ttt.bin
 Produces a structured analysis and Mermaid diagram
 """
+import bisect
+import functools
 import struct
+import sys
 import os
+from array import array
 
-# Unix V4 system calls (EMT 0-23)
-SYSCALLS = {
-    0: 'indir',   1: 'exit',    2: 'fork',   3: 'read',
-    4: 'write',   5: 'open',    6: 'close',  7: 'wait',
-    8: 'creat',   9: 'link',   10: 'unlink', 11: 'exec',
-    12: 'chdir', 13: 'time',  14: 'mknod', 15: 'chmod',
-    16: 'chown', 17: 'break', 18: 'stat',  19: 'seek',
-    20: 'getpid', 21: 'mount', 22: 'umount', 23: 'setuid'
-}
-
-def analyze_binary():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(script_dir, 'ttt.bin'), 'rb') as f:
-        data = f.read()
+from util import SYSCALL_TBL, load_binary, optional_import
 
-    # Parse header
-    magic, text_size = struct.unpack_from('<HH', data, 0)
-    text_start = 0x10
-    text_end = text_start + text_size
+def _jsr_has_extra(word):
+    """True if a JSR's destination operand is followed by an extra word"""
+    mode = (word >> 3) & 7
+    reg = word & 7
+    return mode >= 6 or (mode in (2, 3) and reg == 7)
 
-    print("=" * 70)
-    print("UNIX V4 TTT.BIN CONTROL FLOW ANALYSIS")
-    print("=" * 70)
-    print(f"\nBinary: {len(data)} bytes, Text section: {text_size} bytes")
-    print(f"Load address: 0 (standard Unix text segment)")
-
-    # Find all JSR calls and their targets
+def _scan_text_py(data, text_start, text_end):
+    """Word-by-word scan for JSR calls, branches and system calls"""
     calls = []
     branches = []
     syscalls = []
 
+    end = min(text_end, len(data))
     offset = text_start
-    while offset < text_end:
-        if offset + 2 > len(data):
-            break
+    while offset + 2 <= end:
         word = struct.unpack_from('<H', data, offset)[0]
 
         # JSR instruction: 004rss where r is link register, ss is dest
         if (word >> 9) == 0o004:
-            # JSR detected
             mode = (word >> 3) & 7
             reg = word & 7
             link_reg = (word >> 6) & 7
 
             if mode == 6 and reg == 7:  # PC-relative
-                if offset + 4 <= len(data):
+                if offset + 4 <= end:
                     disp = struct.unpack_from('<h', data, offset + 2)[0]
                     target = offset + 4 + disp - text_start  # Convert to runtime addr
                     calls.append({
@@ -59,15 +44,15 @@ def analyze_binary():
                         'to': target,
                         'link': link_reg
                     })
-            offset += 4  # JSR with displacement is 4 bytes
+            # Only skip the operand word if the addressing mode has one
+            offset += 4 if _jsr_has_extra(word) else 2
             continue
 
         # Branch instructions
-        if (word >> 8) in range(0o001, 0o010) or (word >> 8) in range(0o200, 0o210):
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            target = (offset - text_start) + 2 + disp * 2
+        hi = word >> 8
+        if (0o001 <= hi <= 0o007) or (0o200 <= hi <= 0o207):
+            disp = ((word & 0xFF) ^ 0x80) - 0x80  # sign-extend 8 bits
+            target = (offset - text_start) + 2 + (disp << 1)
             branches.append({
                 'from': offset - text_start,
                 'to': target,
@@ -75,9 +60,9 @@ def analyze_binary():
             })
 
         # System calls (EMT/TRAP)
-        if (word >> 8) == 0o104:
+        if (word >> 9) == 0o104:
             num = word & 0o77
-            name = SYSCALLS.get(num, f'sys{num}')
+            name = SYSCALL_TBL[num] or f'sys{num}'
             syscalls.append({
                 'addr': offset - text_start,
                 'num': num,
@@ -86,92 +71,147 @@ def analyze_binary():
 
         offset += 2
 
-    # Identify function boundaries based on call targets
-    function_starts = set()
-    for call in calls:
-        if 0 <= call['to'] < text_size:
-            function_starts.add(call['to'])
+    return calls, branches, syscalls
 
-    # Known string locations (from strings analysis)
-    strings_map = {
-        0o430: "Tic-Tac-Toe",
-        0o452: "Accumulated knowledge?",
-        0o506: "'bits' of knowledge",
-        0o622: "new game",
-        0o1264: "Illegal move",
-        0o1316: "You win",
-        0o1336: "I concede",
-        0o1410: "I win",
-        # 0o????: "Draw",
-        0o1754: "'bits' returned",
-        0o2162: "/usr/games/ttt.k"
-    }
+def _scan_words(arr, calls, branches, syscalls):
+    """Sequential scan of a uint16 text array, compiled by _scan_kernel.
 
-    print("\n" + "=" * 70)
-    print("IDENTIFIED FUNCTIONS")
-    print("=" * 70)
-
-    # Analyze each potential function
-    functions = {
-        0o020: "main/start",
-        0o040: "getchar_loop",
-        0o110: "skip_whitespace",
-        0o160: "print_loop",
-        0o254: "print_char",
-        0o264: "print_number",
-        0o322: "skip_to_newline",
-        0o336: "print_decimal",
-        0o430: "print_message (str: Tic-Tac-Toe)",
-        0o452: "ask_knowledge",
-        0o506: "show_bits_count",
-        0o540: "init_knowledge",
-        0o622: "game_loop (str: new game)",
-        0o674: "display_board",
-        0o772: "get_player_move",
-        0o1024: "validate_move",
-        0o1056: "computer_move",
-        0o1140: "find_in_knowledge",
-        0o1200: "check_win",
-        0o1264: "show_illegal",
-        0o1316: "player_wins",
-        0o1336: "computer_concedes",
-        0o1356: "update_knowledge",
-        0o1410: "computer_wins",
-        0o1430: "minimax/evaluate",
-        0o1510: "check_board_full",
-        0o1546: "check_line",
-        0o1664: "save_knowledge",
-        0o2024: "win_patterns (data)",
-    }
+    Fills the preallocated calls, branches and syscalls arrays with one
+    row per hit: (from, to, link), (from, to) and (addr, num), addresses
+    relative to the start of text.  Returns the three row counts.
+    """
+    n = arr.shape[0]
+    nc = nb = ns = 0
 
-    for addr in sorted(functions.keys()):
-        print(f"  {addr:06o}: {functions[addr]}")
+    i = 0
+    while i < n:
+        word = int(arr[i])
 
-    print("\n" + "=" * 70)
-    print("SYSTEM CALLS")
-    print("=" * 70)
-    for sc in sorted(syscalls, key=lambda x: x['addr']):
-        context = ""
-        # Find nearby string references
-        for str_addr, string in strings_map.items():
-            if abs(str_addr - sc['addr']) < 0o100:
-                context = f" near '{string[:20]}...'"
-                break
-        print(f"  {sc['addr']:06o}: sys {sc['num']:2d} ({sc['name']:8s}){context}")
-
-    print("\n" + "=" * 70)
-    print("CONTROL FLOW SUMMARY")
-    print("=" * 70)
-    print(f"  Subroutine calls: {len(calls)}")
-    print(f"  Branch instructions: {len(branches)}")
-    print(f"  System calls: {len(syscalls)}")
-
-    # Generate Mermaid diagram
-    print("\n" + "=" * 70)
-    print("MERMAID SEQUENCE DIAGRAM")
-    print("=" * 70)
-
-    mermaid = """
+        if (word >> 9) == 0o004:  # JSR
+            mode = (word >> 3) & 7
+            reg = word & 7
+            if mode == 6 and reg == 7 and i + 1 < n:
+                disp = (int(arr[i + 1]) ^ 0x8000) - 0x8000
+                calls[nc, 0] = i * 2
+                calls[nc, 1] = i * 2 + 4 + disp
+                calls[nc, 2] = (word >> 6) & 7
+                nc += 1
+            if mode >= 6 or ((mode == 2 or mode == 3) and reg == 7):
+                i += 2
+            else:
+                i += 1
+            continue
+
+        hi = word >> 8
+        if (1 <= hi <= 7) or (0o200 <= hi <= 0o207):
+            disp = ((word & 0xFF) ^ 0x80) - 0x80
+            branches[nb, 0] = i * 2
+            branches[nb, 1] = i * 2 + 2 + (disp << 1)
+            nb += 1
+
+        if (word >> 9) == 0o104:
+            syscalls[ns, 0] = i * 2
+            syscalls[ns, 1] = word & 0o77
+            ns += 1
+
+        i += 1
+
+    return nc, nb, ns
+
+# Importing Numba costs far more than scanning a PDP-11 text segment in
+# Python, so the compiled kernel is opt-in (TTT_NUMBA=1)
+USE_NUMBA = os.environ.get('TTT_NUMBA') == '1'
+
+@functools.cache
+def _scan_kernel():
+    """Compile _scan_words on first use; None unless enabled and installed"""
+    if not USE_NUMBA:
+        return None
+    numba = optional_import('numba')
+    if numba is None or optional_import('numpy') is None:
+        return None
+    return numba.njit(cache=True)(_scan_words)
+
+def _scan_text_numba(data, text_start, text_end):
+    """Run the compiled _scan_words kernel and convert its rows to dicts"""
+    import numpy as np
+
+    count = (min(text_end, len(data)) - text_start) // 2
+    arr = np.frombuffer(data, dtype='<u2', count=count, offset=text_start)
+    call_rows = np.empty((count, 3), np.int64)
+    branch_rows = np.empty((count, 2), np.int64)
+    syscall_rows = np.empty((count, 2), np.int64)
+    nc, nb, ns = _scan_kernel()(arr, call_rows, branch_rows, syscall_rows)
+
+    calls = [{'from': f, 'to': t, 'link': link}
+             for f, t, link in call_rows[:nc].tolist()]
+    branches = [{'from': f, 'to': t, 'type': 'branch'}
+                for f, t in branch_rows[:nb].tolist()]
+    syscalls = [{'addr': addr, 'num': num,
+                 'name': SYSCALL_TBL[num] or f'sys{num}'}
+                for addr, num in syscall_rows[:ns].tolist()]
+    return calls, branches, syscalls
+
+def scan_text(data, text_start, text_end):
+    """Find JSR calls, branches and system calls in the text segment.
+
+    Returns (calls, branches, syscalls), each a list of dicts ordered by
+    address.  Uses the Numba kernel when TTT_NUMBA=1 (imported on the
+    first call rather than at module load), else the Python scan.
+    """
+    if _scan_kernel() is not None:
+        return _scan_text_numba(data, text_start, text_end)
+    return _scan_text_py(data, text_start, text_end)
+
+# Known string locations (from strings analysis)
+STRINGS_MAP = {
+    0o430: "Tic-Tac-Toe",
+    0o452: "Accumulated knowledge?",
+    0o506: "'bits' of knowledge",
+    0o622: "new game",
+    0o1264: "Illegal move",
+    0o1316: "You win",
+    0o1336: "I concede",
+    0o1410: "I win",
+    # 0o????: "Draw",
+    0o1754: "'bits' returned",
+    0o2162: "/usr/games/ttt.k"
+}
+
+# Potential functions, identified by hand from the disassembly
+FUNCTIONS = {
+    0o020: "main/start",
+    0o040: "getchar_loop",
+    0o110: "skip_whitespace",
+    0o160: "print_loop",
+    0o254: "print_char",
+    0o264: "print_number",
+    0o322: "skip_to_newline",
+    0o336: "print_decimal",
+    0o430: "print_message (str: Tic-Tac-Toe)",
+    0o452: "ask_knowledge",
+    0o506: "show_bits_count",
+    0o540: "init_knowledge",
+    0o622: "game_loop (str: new game)",
+    0o674: "display_board",
+    0o772: "get_player_move",
+    0o1024: "validate_move",
+    0o1056: "computer_move",
+    0o1140: "find_in_knowledge",
+    0o1200: "check_win",
+    0o1264: "show_illegal",
+    0o1316: "player_wins",
+    0o1336: "computer_concedes",
+    0o1356: "update_knowledge",
+    0o1410: "computer_wins",
+    0o1430: "minimax/evaluate",
+    0o1510: "check_board_full",
+    0o1546: "check_line",
+    0o1664: "save_knowledge",
+    0o2024: "win_patterns (data)",
+}
+
+SEQUENCE_DIAGRAM = """
 ```mermaid
 sequenceDiagram
     participant User
@@ -241,14 +281,8 @@ sequenceDiagram
     end
 ```
 """
-    print(mermaid)
-
-    # Generate control flow diagram
-    print("\n" + "=" * 70)
-    print("MERMAID FLOWCHART")
-    print("=" * 70)
 
-    flowchart = """
+FLOWCHART = """
 ```mermaid
 flowchart TD
     subgraph Initialization
@@ -313,14 +347,8 @@ flowchart TD
     end
 ```
 """
-    print(flowchart)
 
-    # Key algorithm analysis
-    print("\n" + "=" * 70)
-    print("KEY ALGORITHM: LEARNING SYSTEM")
-    print("=" * 70)
-
-    learning_analysis = """
+LEARNING_ANALYSIS = """
 The 1973 ttt uses a simple reinforcement learning approach:
 
 1. KNOWLEDGE STRUCTURE (ttt.k, 268 bytes max):
@@ -357,7 +385,84 @@ The 1973 ttt uses a simple reinforcement learning approach:
    | 100th game   | Rarely loses   | Never loses   |
    | Memory use   | Variable       | Constant      |
 """
-    print(learning_analysis)
+
+def _banner(title, first=False):
+    """Section heading lines for the text report"""
+    rule = "=" * 70
+    return [rule if first else "\n" + rule, title, rule]
+
+def scan_binary(data):
+    """Parse the a.out header and scan the text segment of data.
+
+    Returns a dict with the sizes, the calls/branches/syscalls found by
+    scan_text and the set of call targets inside text.
+    """
+    magic, text_size = struct.unpack_from('<HH', data, 0)
+    text_start = 0x10
+    text_end = text_start + text_size
+
+    calls, branches, syscalls = scan_text(data, text_start, text_end)
+
+    # Identify function boundaries based on call targets
+    function_starts = set()
+    for call in calls:
+        if 0 <= call['to'] < text_size:
+            function_starts.add(call['to'])
+
+    return {
+        'size': len(data),
+        'text_size': text_size,
+        'calls': calls,
+        'branches': branches,
+        'syscalls': syscalls,
+        'function_starts': function_starts,
+    }
+
+def render_report(scan):
+    """Text report: header, known functions, syscalls and summary counts"""
+    out = _banner("UNIX V4 TTT.BIN CONTROL FLOW ANALYSIS", first=True)
+    out.append(f"\nBinary: {scan['size']} bytes, Text section: {scan['text_size']} bytes")
+    out.append(f"Load address: 0 (standard Unix text segment)")
+
+    out += _banner("IDENTIFIED FUNCTIONS")
+    for addr in sorted(FUNCTIONS.keys()):
+        out.append(f"  {addr:06o}: {FUNCTIONS[addr]}")
+
+    out += _banner("SYSTEM CALLS")
+    str_addrs = array('i', sorted(STRINGS_MAP))
+    for sc in sorted(scan['syscalls'], key=lambda x: x['addr']):
+        context = ""
+        # Find the nearest string reference on either side
+        idx = bisect.bisect_left(str_addrs, sc['addr'])
+        near = [str_addrs[i] for i in (idx - 1, idx) if 0 <= i < len(str_addrs)]
+        if near:
+            str_addr = min(near, key=lambda a: abs(a - sc['addr']))
+            if abs(str_addr - sc['addr']) < 0o100:
+                context = f" near '{STRINGS_MAP[str_addr][:20]}...'"
+        out.append(f"  {sc['addr']:06o}: sys {sc['num']:2d} ({sc['name']:8s}){context}")
+
+    out += _banner("CONTROL FLOW SUMMARY")
+    out.append(f"  Subroutine calls: {len(scan['calls'])}")
+    out.append(f"  Branch instructions: {len(scan['branches'])}")
+    out.append(f"  System calls: {len(scan['syscalls'])}")
+    return "\n".join(out)
+
+def render_mermaid():
+    """Mermaid sequence diagram and flowchart sections (fixed, hand-drawn diagrams)"""
+    out = _banner("MERMAID SEQUENCE DIAGRAM")
+    out.append(SEQUENCE_DIAGRAM)
+    out += _banner("MERMAID FLOWCHART")
+    out.append(FLOWCHART)
+    return "\n".join(out)
+
+def analyze_binary():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    scan = scan_binary(load_binary(os.path.join(script_dir, 'ttt.bin')))
+
+    out = [render_report(scan), render_mermaid()]
+    out += _banner("KEY ALGORITHM: LEARNING SYSTEM")
+    out.append(LEARNING_ANALYSIS)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == '__main__':
     analyze_binary()
@@ -3,54 +3,101 @@
 PDP-11 Disassembler for Unix V4 a.out binaries
 Focused on extracting control flow from ttt.bin
 """
-import struct
+import io
 import sys
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 
+from util import SYSCALL_TBL, load_binary, numpy_for
+
 # PDP-11 registers
 REGS = ['r0', 'r1', 'r2', 'r3', 'r4', 'r5', 'sp', 'pc']
 
-# Addressing modes
-def decode_operand(mode: int, reg: int, data: bytes, offset: int) -> Tuple[str, int]:
-    """Decode PDP-11 addressing mode, return (operand_str, bytes_consumed)"""
-    if mode == 0:  # Register
-        return REGS[reg], 0
-    elif mode == 1:  # Register deferred
-        return f"({REGS[reg]})", 0
-    elif mode == 2:  # Autoincrement
-        if reg == 7:  # PC - immediate
-            if offset + 2 <= len(data):
-                val = struct.unpack_from('<H', data, offset)[0]
-                return f"${val:o}", 2
-            return "$?", 0
-        return f"({REGS[reg]})+", 0
-    elif mode == 3:  # Autoincrement deferred
-        if reg == 7:  # Absolute
-            if offset + 2 <= len(data):
-                val = struct.unpack_from('<H', data, offset)[0]
-                return f"*${val:o}", 2
-            return "*$?", 0
-        return f"*({REGS[reg]})+", 0
-    elif mode == 4:  # Autodecrement
-        return f"-({REGS[reg]})", 0
-    elif mode == 5:  # Autodecrement deferred
-        return f"*-({REGS[reg]})", 0
-    elif mode == 6:  # Index
-        if offset + 2 <= len(data):
-            idx = struct.unpack_from('<h', data, offset)[0]  # signed
-            if reg == 7:  # PC-relative
-                return f"{idx:o}(pc)", 2
-            return f"{idx:o}({REGS[reg]})", 2
-        return f"?({REGS[reg]})", 0
-    elif mode == 7:  # Index deferred
-        if offset + 2 <= len(data):
-            idx = struct.unpack_from('<h', data, offset)[0]
-            if reg == 7:
-                return f"*{idx:o}(pc)", 2
-            return f"*{idx:o}({REGS[reg]})", 2
-        return f"*?({REGS[reg]})", 0
-    return "???", 0
+# Operand strings for the register-only addressing modes, indexed by reg
+OP_DEFER = tuple(f"({r})" for r in REGS)
+OP_AUTOINC = tuple(f"({r})+" for r in REGS)
+OP_AUTOINC_DEFER = tuple(f"*({r})+" for r in REGS)
+OP_AUTODEC = tuple(f"-({r})" for r in REGS)
+OP_AUTODEC_DEFER = tuple(f"*-({r})" for r in REGS)
+
+# Opcode dispatch tables, keyed by the bits that select the instruction
+MISC_OP = {  # whole word
+    0: 'halt', 1: 'wait', 2: 'rti', 3: 'bpt', 4: 'iot', 5: 'reset', 6: 'rtt'
+}
+SINGLE_OP = {  # word >> 6
+    0o001: 'jmp', 0o003: 'swab',
+    0o050: 'clr', 0o051: 'com', 0o052: 'inc', 0o053: 'dec',
+    0o054: 'neg', 0o055: 'adc', 0o056: 'sbc', 0o057: 'tst',
+    0o060: 'ror', 0o061: 'rol', 0o062: 'asr', 0o063: 'asl'
+}
+BRANCH_OP = {  # word >> 8
+    0o001: 'br',  0o002: 'bne', 0o003: 'beq', 0o004: 'bge',
+    0o005: 'blt', 0o006: 'bgt', 0o007: 'ble',
+    0o200: 'bpl', 0o201: 'bmi', 0o202: 'bhi', 0o203: 'blos',
+    0o204: 'bvc', 0o205: 'bvs', 0o206: 'bcc', 0o207: 'bcs'
+}
+DOUBLE_OP = {  # word >> 12
+    0o01: 'mov',  0o02: 'cmp',  0o03: 'bit',  0o04: 'bic',
+    0o05: 'bis',  0o06: 'add',  0o16: 'sub',
+    0o11: 'movb', 0o12: 'cmpb', 0o13: 'bitb', 0o14: 'bicb', 0o15: 'bisb'
+}
+
+# Addressing modes: one handler per mode, each taking (reg, words, swords,
+# widx) and returning (operand_str, bytes_consumed)
+def _op_register(reg, words, swords, widx):
+    return REGS[reg], 0
+
+def _op_deferred(reg, words, swords, widx):
+    return OP_DEFER[reg], 0
+
+def _op_autoinc(reg, words, swords, widx):
+    if reg == 7:  # PC - immediate
+        if widx < len(words):
+            return f"${words[widx]:o}", 2
+        return "$?", 0
+    return OP_AUTOINC[reg], 0
+
+def _op_autoinc_deferred(reg, words, swords, widx):
+    if reg == 7:  # Absolute
+        if widx < len(words):
+            return f"*${words[widx]:o}", 2
+        return "*$?", 0
+    return OP_AUTOINC_DEFER[reg], 0
+
+def _op_autodec(reg, words, swords, widx):
+    return OP_AUTODEC[reg], 0
+
+def _op_autodec_deferred(reg, words, swords, widx):
+    return OP_AUTODEC_DEFER[reg], 0
+
+def _op_index(reg, words, swords, widx):
+    if widx < len(swords):
+        return f"{swords[widx]:o}({REGS[reg]})", 2  # signed
+    return f"?({REGS[reg]})", 0
+
+def _op_index_deferred(reg, words, swords, widx):
+    if widx < len(swords):
+        return f"*{swords[widx]:o}({REGS[reg]})", 2
+    return f"*?({REGS[reg]})", 0
+
+OPERAND_HANDLERS = (
+    _op_register, _op_deferred, _op_autoinc, _op_autoinc_deferred,
+    _op_autodec, _op_autodec_deferred, _op_index, _op_index_deferred
+)
+
+def decode_operand(mode: int, reg: int, words: memoryview, swords: memoryview,
+                   widx: int) -> Tuple[str, int]:
+    """Decode PDP-11 addressing mode, return (operand_str, bytes_consumed)
+
+    widx is the index of the operand's extension word in words/swords.
+    """
+    return OPERAND_HANDLERS[mode](reg, words, swords, widx)
+
+# Disasm.flags bits
+BRANCH = 1
+CALL = 2
+RETURN = 4
 
 @dataclass
 class Instruction:
@@ -65,350 +112,131 @@ class Instruction:
     branch_target: Optional[int] = None
     comment: str = ""
 
-def disassemble_one(data: bytes, offset: int, base_addr: int) -> Instruction:
-    """Disassemble one instruction"""
-    if offset + 2 > len(data):
-        return Instruction(base_addr + offset, 0, ".word", "???", 2)
-
-    word = struct.unpack_from('<H', data, offset)[0]
+@dataclass
+class Disasm:
+    """Struct-of-arrays disassembly: index i of every column is instruction i"""
+    addrs: array = field(default_factory=lambda: array('l'))
+    opcodes: array = field(default_factory=lambda: array('H'))
+    sizes: array = field(default_factory=lambda: array('B'))
+    flags: array = field(default_factory=lambda: array('B'))
+    targets: array = field(default_factory=lambda: array('l'))  # 0 = none
+    mnemonics: List[str] = field(default_factory=list)
+    operands: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.addrs)
+
+def word_views(data: bytes) -> Tuple[memoryview, memoryview]:
+    """Return unsigned and signed 16-bit views of data (PDP-11 is little-endian)"""
+    mv = memoryview(data)[:len(data) & ~1]
+    if sys.byteorder != 'little':
+        swapped = array('H', mv.tobytes())
+        swapped.byteswap()
+        mv = memoryview(swapped).cast('B')
+    return mv.cast('H'), mv.cast('h')
+
+def _decode_single(word: int, words: memoryview, swords: memoryview,
+                   widx: int) -> Tuple[str, int]:
+    """Decode the destination field (bits 5-0) of the instruction at widx"""
+    return decode_operand((word >> 3) & 7, word & 7, words, swords, widx + 1)
+
+def _decode(words: memoryview, swords: memoryview, offset: int,
+            base_addr: int) -> Tuple[int, str, str, int, int, int]:
+    """Decode the instruction at byte offset into words/swords.
+
+    Returns (opcode, mnemonic, operands, size, flags, branch_target), with
+    branch_target 0 when the instruction has none.
+    """
+    widx = offset >> 1
+    if widx >= len(words):
+        return 0, ".word", "???", 2, 0, 0
+
+    word = words[widx]
     addr = base_addr + offset
     size = 2
     mnemonic = "???"
     operands = ""
-    is_branch = False
-    is_call = False
-    is_return = False
-    branch_target = None
+    flags = 0
+    branch_target = 0
 
     # Decode instruction
-    op = (word >> 12) & 0xF
+    single = SINGLE_OP.get(word >> 6)
+    branch = BRANCH_OP.get(word >> 8)
+    double = DOUBLE_OP.get(word >> 12)
 
-    # Double operand instructions
-    if op in [1, 2, 3, 4, 5, 6]:
-        src_mode = (word >> 9) & 7
-        src_reg = (word >> 6) & 7
-        dst_mode = (word >> 3) & 7
-        dst_reg = word & 7
-
-        mnemonics = {1: 'mov', 2: 'cmp', 3: 'bit', 4: 'bic', 5: 'bis', 6: 'add'}
-        mnemonic = mnemonics[op]
-
-        src, src_bytes = decode_operand(src_mode, src_reg, data, offset + 2)
-        size += src_bytes
-        dst, dst_bytes = decode_operand(dst_mode, dst_reg, data, offset + size)
+    if single is not None:
+        mnemonic = single
+        operands, dst_bytes = _decode_single(word, words, swords, widx)
         size += dst_bytes
-        operands = f"{src}, {dst}"
+        if single == "jmp":
+            flags = BRANCH
 
-    elif op == 0o16:  # sub
+    elif branch is not None:
+        mnemonic = branch
+        disp = ((word & 0xFF) ^ 0x80) - 0x80  # sign-extend 8 bits
+        branch_target = addr + 2 + (disp << 1)
+        operands = f"{branch_target:o}"
+        flags = BRANCH
+
+    elif double is not None:
+        mnemonic = double
         src_mode = (word >> 9) & 7
         src_reg = (word >> 6) & 7
         dst_mode = (word >> 3) & 7
         dst_reg = word & 7
-        mnemonic = 'sub'
-        src, src_bytes = decode_operand(src_mode, src_reg, data, offset + 2)
+        src, src_bytes = decode_operand(src_mode, src_reg, words, swords, widx + 1)
         size += src_bytes
-        dst, dst_bytes = decode_operand(dst_mode, dst_reg, data, offset + size)
+        dst, dst_bytes = decode_operand(dst_mode, dst_reg, words, swords, widx + (size >> 1))
         size += dst_bytes
         operands = f"{src}, {dst}"
 
-    elif op == 0o07:  # EIS: mul, div, ash, ashc
-        pass
-
-    elif op == 0:
-        # Branch and single operand instructions
-        if (word >> 8) == 0:
-            # Misc instructions
-            if word == 0:
-                mnemonic = "halt"
-            elif word == 1:
-                mnemonic = "wait"
-            elif word == 2:
-                mnemonic = "rti"
-                is_return = True
-            elif word == 3:
-                mnemonic = "bpt"
-            elif word == 4:
-                mnemonic = "iot"
-            elif word == 5:
-                mnemonic = "reset"
-            elif word == 6:
-                mnemonic = "rtt"
-                is_return = True
-        elif (word >> 6) == 0o001:  # JMP
-            mnemonic = "jmp"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-            is_branch = True
-        elif (word >> 6) == 0o003:  # SWAB
-            mnemonic = "swab"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 8) == 0o001:  # BR
-            mnemonic = "br"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 8) == 0o002:  # BNE
-            mnemonic = "bne"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 8) == 0o003:  # BEQ
-            mnemonic = "beq"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 8) == 0o004:  # BGE
-            mnemonic = "bge"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 8) == 0o005:  # BLT
-            mnemonic = "blt"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 8) == 0o006:  # BGT
-            mnemonic = "bgt"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 8) == 0o007:  # BLE
-            mnemonic = "ble"
-            disp = word & 0xFF
-            if disp > 127:
-                disp -= 256
-            branch_target = addr + 2 + disp * 2
-            operands = f"{branch_target:o}"
-            is_branch = True
-        elif (word >> 6) == 0o050:  # CLR
-            mnemonic = "clr"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o051:  # COM
-            mnemonic = "com"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o052:  # INC
-            mnemonic = "inc"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o053:  # DEC
-            mnemonic = "dec"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o054:  # NEG
-            mnemonic = "neg"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o055:  # ADC
-            mnemonic = "adc"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o056:  # SBC
-            mnemonic = "sbc"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o057:  # TST
-            mnemonic = "tst"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o060:  # ROR
-            mnemonic = "ror"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o061:  # ROL
-            mnemonic = "rol"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o062:  # ASR
-            mnemonic = "asr"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 6) == 0o063:  # ASL
-            mnemonic = "asl"
-            mode = (word >> 3) & 7
-            reg = word & 7
-            dst, dst_bytes = decode_operand(mode, reg, data, offset + 2)
-            size += dst_bytes
-            operands = dst
-        elif (word >> 9) == 0o004:  # JSR
-            mnemonic = "jsr"
-            reg = (word >> 6) & 7
-            mode = (word >> 3) & 7
-            dst_reg = word & 7
-            dst, dst_bytes = decode_operand(mode, dst_reg, data, offset + 2)
-            size += dst_bytes
-            operands = f"{REGS[reg]}, {dst}"
-            is_call = True
-        elif (word >> 3) == 0o00020:  # RTS
-            mnemonic = "rts"
-            operands = REGS[word & 7]
-            is_return = True
-
-    elif op == 0o10:  # Byte instructions: MOVB, CMPB, etc
-        sub_op = (word >> 12) & 0xF
-        if sub_op == 0o11:
-            mnemonic = "movb"
-        elif sub_op == 0o12:
-            mnemonic = "cmpb"
-        elif sub_op == 0o13:
-            mnemonic = "bitb"
-        elif sub_op == 0o14:
-            mnemonic = "bicb"
-        elif sub_op == 0o15:
-            mnemonic = "bisb"
-        src_mode = (word >> 9) & 7
-        src_reg = (word >> 6) & 7
-        dst_mode = (word >> 3) & 7
-        dst_reg = word & 7
-        src, src_bytes = decode_operand(src_mode, src_reg, data, offset + 2)
-        size += src_bytes
-        dst, dst_bytes = decode_operand(dst_mode, dst_reg, data, offset + size)
+    elif (word >> 9) == 0o004:  # JSR
+        mnemonic = "jsr"
+        reg = (word >> 6) & 7
+        dst, dst_bytes = _decode_single(word, words, swords, widx)
         size += dst_bytes
-        operands = f"{src}, {dst}"
+        operands = f"{REGS[reg]}, {dst}"
+        flags = CALL
 
-    elif (word >> 8) == 0o200:  # BPL
-        mnemonic = "bpl"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o201:  # BMI
-        mnemonic = "bmi"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o202:  # BHI
-        mnemonic = "bhi"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o203:  # BLOS
-        mnemonic = "blos"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o204:  # BVC
-        mnemonic = "bvc"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o205:  # BVS
-        mnemonic = "bvs"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o206:  # BCC/BHIS
-        mnemonic = "bcc"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o207:  # BCS/BLO
-        mnemonic = "bcs"
-        disp = word & 0xFF
-        if disp > 127:
-            disp -= 256
-        branch_target = addr + 2 + disp * 2
-        operands = f"{branch_target:o}"
-        is_branch = True
-    elif (word >> 8) == 0o104:  # EMT/TRAP
+    elif (word >> 3) == 0o00020:  # RTS
+        mnemonic = "rts"
+        operands = REGS[word & 7]
+        flags = RETURN
+
+    elif word in MISC_OP:  # halt, wait, rti, ...
+        mnemonic = MISC_OP[word]
+        if mnemonic in ("rti", "rtt"):
+            flags = RETURN
+
+    elif (word >> 9) == 0o104:  # EMT/TRAP
         if word & 0x100:
-            mnemonic = "trap"
+            mnemonic = "sys"  # TRAP - Unix system calls
         else:
-            mnemonic = "sys"  # EMT - Unix system calls
+            mnemonic = "emt"
         operands = f"{word & 0xFF}"
-        is_call = True
+        flags = CALL
 
     # Unknown - show as data
     if mnemonic == "???":
         mnemonic = ".word"
         operands = f"{word:06o}"
 
-    return Instruction(addr, word, mnemonic, operands, size,
-                       is_branch, is_call, is_return, branch_target)
+    return word, mnemonic, operands, size, flags, branch_target
+
+def disassemble_one(words: memoryview, swords: memoryview, offset: int,
+                    base_addr: int) -> Instruction:
+    """Disassemble one instruction at byte offset into words/swords"""
+    opcode, mnemonic, operands, size, flags, target = \
+        _decode(words, swords, offset, base_addr)
+    return Instruction(base_addr + offset, opcode, mnemonic, operands, size,
+                       bool(flags & BRANCH), bool(flags & CALL),
+                       bool(flags & RETURN), target or None)
 
 def parse_aout_header(data: bytes) -> Dict:
     """Parse Unix a.out header"""
+    words, _ = word_views(data)
     magic, text_size, data_size, bss_size, sym_size, entry, unused, reloc = \
-        struct.unpack_from('<8H', data, 0)
+        words[:8]
     return {
         'magic': magic,
         'text_size': text_size,
@@ -419,18 +247,26 @@ def parse_aout_header(data: bytes) -> Dict:
         'reloc_suppressed': reloc
     }
 
-def disassemble(data: bytes, start: int = 0x10, base: int = 0) -> List[Instruction]:
+def disassemble(data: bytes, start: int = 0x10, base: int = 0) -> Disasm:
     """Disassemble entire text section"""
-    instructions = []
+    words, swords = word_views(data)
+    dis = Disasm()
     offset = start
     while offset < len(data):
-        inst = disassemble_one(data, offset, base)
-        instructions.append(inst)
-        offset += inst.size
-    return instructions
-
-def find_strings(data: bytes) -> Dict[int, str]:
-    """Find string constants in the binary"""
+        opcode, mnemonic, operands, size, flags, target = \
+            _decode(words, swords, offset, base)
+        dis.addrs.append(base + offset)
+        dis.opcodes.append(opcode)
+        dis.sizes.append(size)
+        dis.flags.append(flags)
+        dis.targets.append(target)
+        dis.mnemonics.append(mnemonic)
+        dis.operands.append(operands)
+        offset += size
+    return dis
+
+def _find_strings_py(data: bytes) -> Dict[int, str]:
+    """Byte-by-byte scan for runs of 4 or more printable ASCII characters"""
     strings = {}
     i = 0
     while i < len(data):
@@ -448,21 +284,38 @@ def find_strings(data: bytes) -> Dict[int, str]:
             i += 1
     return strings
 
-def analyze_control_flow(instructions: List[Instruction]) -> Dict:
+def _find_strings_numpy(data: bytes) -> Dict[int, str]:
+    """Vectorized equivalent of _find_strings_py"""
+    import numpy as np
+
+    arr = np.frombuffer(data, dtype=np.uint8)
+    printable = ((arr >= 0x20) & (arr < 0x7F)).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], printable, [0])))
+    starts = np.nonzero(edges == 1)[0]
+    ends = np.nonzero(edges == -1)[0]
+    keep = (ends - starts) >= 4
+    return {start: data[start:end].decode('ascii')
+            for start, end in zip(starts[keep].tolist(), ends[keep].tolist())}
+
+def find_strings(data: bytes) -> Dict[int, str]:
+    """Find string constants in the binary (NumPy is used only for large inputs)"""
+    if numpy_for(len(data)) is not None:
+        return _find_strings_numpy(data)
+    return _find_strings_py(data)
+
+def analyze_control_flow(dis: Disasm) -> Dict:
     """Analyze control flow and identify functions"""
     # Find all call targets (function entries)
     call_targets = set()
     branch_targets = set()
-
-    for inst in instructions:
-        if inst.is_call and inst.branch_target:
-            call_targets.add(inst.branch_target)
-        if inst.is_branch and inst.branch_target:
-            branch_targets.add(inst.branch_target)
+    for flags, target in zip(dis.flags, dis.targets):
+        if flags & CALL and target:
+            call_targets.add(target)
+        if flags & BRANCH and target:
+            branch_targets.add(target)
 
     # Find function boundaries (after RTS)
-    function_starts = {0}  # Entry point
-    function_starts.update(call_targets)
+    function_starts = call_targets | {0}  # Entry point
 
     return {
         'call_targets': sorted(call_targets),
@@ -473,72 +326,69 @@ def analyze_control_flow(instructions: List[Instruction]) -> Dict:
 def main():
     import os
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(script_dir, 'ttt.bin'), 'rb') as f:
-        data = f.read()
+    data = load_binary(os.path.join(script_dir, 'ttt.bin'))
 
     header = parse_aout_header(data)
-    print("=== Unix V4 a.out Header ===")
-    print(f"Magic:      {header['magic']:06o} (should be 000407)")
-    print(f"Text size:  {header['text_size']} bytes")
-    print(f"Data size:  {header['data_size']} bytes")
-    print(f"BSS size:   {header['bss_size']} bytes")
-    print(f"Entry:      {header['entry']:06o}")
-    print()
+    buf = io.StringIO()
+    w = buf.write
+    w("=== Unix V4 a.out Header ===\n")
+    w(f"Magic:      {header['magic']:06o} (should be 000407)\n")
+    w(f"Text size:  {header['text_size']} bytes\n")
+    w(f"Data size:  {header['data_size']} bytes\n")
+    w(f"BSS size:   {header['bss_size']} bytes\n")
+    w(f"Entry:      {header['entry']:06o}\n")
+    w("\n")
 
     # Text starts after 16-byte header
     text_start = 0x10
     text_end = text_start + header['text_size']
 
-    print("=== Disassembly ===")
-    instructions = disassemble(data, text_start, 0)
-
-    # Annotate with strings
-    strings = find_strings(data)
-
-    # Build address-to-string map
-    str_refs = {}
-    for off, s in strings.items():
-        str_refs[off] = s
+    w("=== Disassembly ===\n")
+    dis = disassemble(data, text_start, 0)
 
     # Print with analysis
-    cf = analyze_control_flow(instructions)
+    cf = analyze_control_flow(dis)
+    function_starts = set(cf['function_starts'])
+    branch_targets = set(cf['branch_targets'])
 
-    for inst in instructions:
-        prefix = ""
-        if inst.addr in cf['function_starts']:
-            prefix = "\n; === FUNCTION ==="
-            print(prefix)
-        elif inst.addr in cf['branch_targets']:
-            prefix = "; --- label ---"
-            print(prefix)
+    for addr, opcode, mnemonic, operands in zip(dis.addrs, dis.opcodes,
+                                                dis.mnemonics, dis.operands):
+        if addr in function_starts:
+            w("\n; === FUNCTION ===\n")
+        elif addr in branch_targets:
+            w("; --- label ---\n")
 
         # Check for string references
         comment = ""
-        if "jsr" in inst.mnemonic and "pc" in inst.operands:
+        if "jsr" in mnemonic and "pc" in operands:
             comment = "  ; subroutine call"
-        if inst.mnemonic == "sys":
+        if mnemonic == "sys":
             # Unix V4 system calls
-            syscalls = {
-                0: 'indir', 1: 'exit', 2: 'fork', 3: 'read', 4: 'write',
-                5: 'open', 6: 'close', 8: 'creat', 9: 'link', 10: 'unlink',
-                11: 'exec', 12: 'chdir', 15: 'chmod', 17: 'break', 19: 'seek',
-                20: 'getpid', 21: 'mount', 23: 'setuid'
-            }
-            num = int(inst.operands) if inst.operands.isdigit() else 0
-            if num in syscalls:
-                comment = f"  ; {syscalls[num]}()"
-
-        print(f"{inst.addr:06o}: {inst.opcode:06o}  {inst.mnemonic:6s} {inst.operands:20s}{comment}")
-
-    print("\n=== Control Flow Summary ===")
-    print(f"Possible functions at: {[f'{a:06o}' for a in cf['function_starts']]}")
-    print(f"Branch targets: {len(cf['branch_targets'])}")
+            num = int(operands) if operands.isdigit() else 0
+            name = SYSCALL_TBL[num] if num < len(SYSCALL_TBL) else None
+            if name:
+                comment = f"  ; {name}()"
+
+        # %-formatting and ljust avoid re-parsing f-string format specs
+        w("%06o: %06o  " % (addr, opcode))
+        w(mnemonic.ljust(6))
+        w(" ")
+        w(operands.ljust(20))
+        w(comment)
+        w("\n")
+
+    w("\n=== Control Flow Summary ===\n")
+    w(f"Possible functions at: {[f'{a:06o}' for a in cf['function_starts']]}\n")
+    w(f"Branch targets: {len(cf['branch_targets'])}\n")
 
     # Print strings found
-    print("\n=== Strings ===")
+    strings = find_strings(data)
+    w("\n=== Strings ===\n")
     for off, s in sorted(strings.items()):
         if len(s) > 3:
-            print(f"  {off:06o}: \"{s}\"")
+            w(f"  {off:06o}: \"{s}\"\n")
+
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == '__main__':
     main()
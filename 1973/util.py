@@ -0,0 +1,42 @@
+"""
+Shared helpers for the ttt.bin analysis scripts
+"""
+import functools
+import importlib
+
+# Unix V4 system calls (EMT 0-23)
+SYSCALLS = {
+    0: 'indir',   1: 'exit',    2: 'fork',   3: 'read',
+    4: 'write',   5: 'open',    6: 'close',  7: 'wait',
+    8: 'creat',   9: 'link',   10: 'unlink', 11: 'exec',
+    12: 'chdir', 13: 'time',  14: 'mknod', 15: 'chmod',
+    16: 'chown', 17: 'break', 18: 'stat',  19: 'seek',
+    20: 'getpid', 21: 'mount', 22: 'umount', 23: 'setuid'
+}
+
+# SYSCALLS as a list indexed by the 6-bit call number (None = unknown)
+SYSCALL_TBL = [SYSCALLS.get(num) for num in range(64)]
+
+@functools.lru_cache(maxsize=4)
+def load_binary(path: str) -> bytes:
+    """Read a binary file, caching the contents for repeated analyses"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+@functools.cache
+def optional_import(name: str):
+    """Import module name on first use, or return None if it is not installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+# The stdlib byte scans take ~0.13 ms per KB; importing NumPy takes ~60 ms,
+# so it only pays for itself on inputs of this many bytes or more
+NUMPY_MIN_SIZE = 512 * 1024
+
+def numpy_for(nbytes: int):
+    """NumPy if an input of nbytes bytes is worth importing it for, else None"""
+    if nbytes < NUMPY_MIN_SIZE:
+        return None
+    return optional_import('numpy')
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+build_tables.py - Generate perfect_play.py from the minimax solver
+
+Runs the solver in ttt_minimax once and writes its answer as data:
+BEST_MOVE, one byte per base-3 board, so play needs no search at all.
+Rerun after changing the solver:
+
+    python3 2024/build_tables.py [output]
+"""
+
+import sys
+from pathlib import Path
+
+from ttt_minimax import (NUM_BOARDS, NO_MOVE, UNSOLVED, WINNER, is_full,
+                         search_best_move, value_table, x_to_move)
+
+HEADER = '''"""
+perfect_play.py - Optimal move for every tic-tac-toe board
+
+Generated by build_tables.py from the ttt_minimax solver; do not edit.
+BEST_MOVE[board] is the cell (0-8) the side to move should take, with
+boards as base-3 ints (digit i = cell i, 0 = empty, 1 = X, 2 = O), or
+0xFF for boards that are finished or cannot occur in a game.
+"""
+'''
+
+def build_best_moves() -> bytes:
+    """Solve every board for the side to move; NO_MOVE where there is none."""
+    value = value_table()
+    moves = bytearray([NO_MOVE]) * NUM_BOARDS
+    for board in range(NUM_BOARDS):
+        if value[board] == UNSOLVED or WINNER[board]:
+            continue
+        if is_full(board):
+            continue  # drawn
+        moves[board] = search_best_move(board, x_to_move(board))
+    return bytes(moves)
+
+def render_module(moves: bytes, width: int = 64) -> str:
+    hex_str = moves.hex()
+    lines = [HEADER, "BEST_MOVE = bytes.fromhex("]
+    lines += [f"    '{hex_str[i:i + width]}'" for i in range(0, len(hex_str), width)]
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+def main():
+    if len(sys.argv) > 1:
+        path = Path(sys.argv[1])
+    else:
+        path = Path(__file__).parent / "perfect_play.py"
+
+    moves = build_best_moves()
+    path.write_text(render_module(moves))
+    playable = sum(m != NO_MOVE for m in moves)
+    print(f"Wrote {path}: {len(moves)} entries, {playable} positions with a move")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,627 @@
+"""
+perfect_play.py - Optimal move for every tic-tac-toe board
+
+Generated by build_tables.py from the ttt_minimax solver; do not edit.
+BEST_MOVE[board] is the cell (0-8) the side to move should take, with
+boards as base-3 ints (digit i = cell i, 0 = empty, 1 = X, 2 = O), or
+0xFF for boards that are finished or cannot occur in a game.
+"""
+
+BEST_MOVE = bytes.fromhex(
+    '0004ff00ff03ff03ff04ff05ffff030404ffff03ff0405ffffffff00ff01ffff'
+    '040002ffffff04ffffff04ff040001ff08ff04ff04ffff01ff0002ffffffff00'
+    '01ff00ff04ff04ffffffffff04ffffffff00ff01ffff070002ffffff06ffffff'
+    '00ff030008ff07ff03ff03ffffff05ffffff00ff02ffffffffffffffff0505ff'
+    '01ffff050005ff0001ff00ff06ff02ff00ff06ffff060005ffff01ff0005ffff'
+    'ffffff01ff0002ffffffff0001ff00ff08ff07ffffffffff06ffffffff0006ff'
+    '00ff08ff06ff00ff08ffff080707ffff06ff0606ffffffffffffffff02ffffff'
+    'ffff01ff00ffffffffffffffffffffffffffff02ff02ffff060204ffffff01ff'
+    'ffff00ff030003ff03ff04ff03ffffff04ffffff04ff02ffffffffffffffff04'
+    '04ff04ffff040004ff0002ff02ff06ff08ff08ff06ffff060408ffff01ff0004'
+    'ffffffffffff03ffffff00ff02ffffffffffffffff0303ff01ffff030003ffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffff00ff06ffff06'
+    '0208ffffff06ffffff00ff060008ff07ff07ff08ff0001ff00ff08ff07ff08ff'
+    '08ffff080807ffff06ff0606ffffffff00ff01ffff020006ffffff08ffffff07'
+    'ff080006ff00ff06ff06ffff02ff0202ffffffff0001ff00ff08ff08ffffffff'
+    'ff06ffffffffff02ff0202ffffffff0001ff00ff04ff04ffffffffff03ffffff'
+    'ff0006ff00ff02ff04ff00ff01ffff040606ffff06ff0806ffffffffffffffff'
+    '02ffffffffff01ff00ffffffffffffffffffffffffffff0001ff00ff02ff02ff'
+    '00ff01ffff030003ffff08ff0708ffffffff00ff01ffff070002ffffff06ffff'
+    'ff06ff060808ff08ff07ff06ffff01ff0002ffffffff0001ff00ff06ff06ffff'
+    'ffffff07ffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffff'
+    'ffffffff01ff0002ffffffff0001ff00ff08ff06ffffffffff06ffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffff04ff02ffff0400'
+    '02ffffff01ffffff04ff040001ff04ff07ff03ffffff01ffffff00ff02ffffff'
+    'ffffffffff0400ff01ffff0800ffff0404ff04ff04ff04ff04ff04ffff040404'
+    'ffff08ff0705ffffffffffff02ffffff00ff02ffffffffffffffffff00ff01ff'
+    'ff070003ffffffffffffffffff02ffffffffffffffffffffff01ffffff00ffff'
+    '00ff01ffff020002ffffffffffffffffffff0708ff07ff07ff08ff0003ff00ff'
+    '08ff03ff01ff08ffff030703ffff03ff0003ffffffff00ff08ffff0800ffffff'
+    'ff01ffffff00ff0500ffff00ff08ffffffff05ff0505ffffffff0501ff00ff05'
+    'ff05ffffffffff05ffffffffffff02ffffff04ff02ffffffffffffffff0300ff'
+    '01ffff040003ffffffffffffffffff02ffffffffffffffffffffff01ffffff00'
+    'ffff02ff01ffff020204ffffff01ffffff00ff040004ff04ff07ff08ffffffff'
+    'ffffffffff02ffffffffffffffffffffff01ffffff00ffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffff02ffffff02ff02ffffffff'
+    'ffffffffff00ff01ffff070008ff01ff08ffff080707ffffff08ffffff07ff08'
+    '0003ff00ff08ff03ffffff01ffffff00ff02ffffffffffffffff0700ff01ffff'
+    '0800ffff0801ff02ff08ff07ff08ff08ffff080807ffff01ff0007ffffffff00'
+    '01ff04ff04ff02ff04ff04ffff040003ffff03ff0803ffffffff00ff02ffff08'
+    '00ffffffff04ffffff00ff0400ffff08ff08ffffffff04ff0402ffffffff0404'
+    'ff04ff04ff04ffffffffff04ffffffff00ff01ffff020002ffffffffffffffff'
+    'ffff0808ff08ff07ff03ffffff02ffffff00ff02ffffffffffffffffff00ff01'
+    'ffff0800ffff0001ff00ff02ff02ffffffffffffffffffffff08ff0708ffffff'
+    'ffff03ff0303ffffffff0303ff00ff03ff03ffffffffff03ffffffff00ffff00'
+    'ff08ffffff00ff08ffff0800ffffffffff00ffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffff01ff0002ffffffff0001ff00ff'
+    '03ff08ffffffffff04ffffffff0207ff08ff04ff04ff04ff05ffff080507ffff'
+    '04ff0404ffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffff'
+    'ffffff0008ff07ff03ff03ff00ff03ffff030508ffff01ff0003ffffffff05ff'
+    '01ffff020002ffffff05ffffff05ff050001ff00ff05ff05ffff01ff0002ffff'
+    'ffff0001ff00ffffff08ffffffffff05ffffffffffffffff02ffffffffff01ff'
+    '00ffffffffffffffffffffffffffffff02ff0202ffffffff0001ff00ff08ff07'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffff0808ff00ff02ff04ff08ff03ffff030308ffff04ff0404ffffffff'
+    '04ff02ffff040204ffffff01ffffff00ff040404ff04ff04ff04ffff01ff0002'
+    'ffffffff0001ff00ffffff08ffffffffff04ffffffff03ff03ffff030002ffff'
+    'ff03ffffff00ff030001ff00ff03ff03ffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffff0008ff00ffffff08ff00ffffffffff0808ffff01'
+    'ff0007ffffffffff02ff0202ffffffff0001ff00ff08ff08ffffffffffffffff'
+    'ffff0001ff00ff02ff02ff08ff08ffff080807ffffffffffffffffffffffffff'
+    'ff02ffffffffff01ff00ffffffffffffffffffffffffffffffffffff02ffffff'
+    'ffff01ff00ffffffffffffffffffffffffffffff02ff0202ffffffff0001ff00'
+    'ff04ff04ffffffffff04ffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffff01ff0002ffffffff0001ff00ff07ff08ffffffffff07'
+    'ffffffff0108ff07ff07ff08ff00ff01ffff070008ffff08ff0708ffffffffff'
+    'ffffff02ffffffffff01ff00ffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffff02ffffffffff01'
+    'ff00ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffff01ff06ffff040006ffffff06ffffff06ff030808ff'
+    '04ff04ff03ffffff02ffffff06ff02ffffffffffffffff0400ff01ffff040004'
+    'ff0404ff04ff04ff08ff04ff06ffff040604ffff04ff0404ffffffffffff01ff'
+    'ffff00ff02ffffffffffffffff0601ff01ffffff0008ffffffffffffffffff02'
+    'ffffffffffffffffffffff01ffffff00ffff00ff01ffffff0608ffffff06ffff'
+    'ff06ff060001ffffffffff08ff0003ff00ff02ff06ff03ff08ffff030803ffff'
+    '06ff0003ffffffff00ff08ffff020606ffffff08ffffff06ff080606ff00ff05'
+    'ff06ffff05ff0002ffffffff0505ff00ff05ff05ffffffffff05ffffffffffff'
+    '02ffffff06ff02ffffffffffffffff0300ff01ffff040003ffffffffffffffff'
+    'ff02ffffffffffffffffffffff01ffffff00ffff02ff06ffff040808ffffff06'
+    'ffffff08ff060004ff04ff04ff08ffffffffffffffffff02ffffffffffffffff'
+    'ffffff01ffffff00ffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffff01ffffff00ff02ffffffffffffffff0601ff01ffffff0008ff'
+    '02ff08ffff020806ffffff08ffffff08ff080606ff00ff03ff06ffffff01ffff'
+    'ff00ff02ffffffffffffffff0800ff01ffff060006ff0802ff00ff02ff08ff08'
+    'ff08ffff060808ffff06ff0606ffffffff0404ff04ff04ff06ff04ff04ffff04'
+    '0604ffff08ff0404ffffffff00ff01ffff040606ffffff04ffffff06ff060806'
+    'ff04ff04ff06ffff04ff0404ffffffff0404ff04ff04ff04ffffffffff04ffff'
+    'ffff00ff01ffffff0608ffffff01ffffff06ff060108ffffffffff08ffffff01'
+    'ffffff02ff02ffffffffffffffff0601ff01ffffff0008ff0001ffffffffff02'
+    'ff00ff01ffffff0006ffff01ffffffffffffffff03ff0002ffffffff0303ff00'
+    'ff03ff03ffffffffff03ffffffff0606ff02ff08ff06ff00ff08ffff080606ff'
+    'ff06ff0006ffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffff01ffffff08ff02ffffffffffffffff0308ff01ffff030003ffff'
+    'ffffffffffffff02ffffffffffffffffffffff01ffffff00ffff00ff01ffff02'
+    '0208ffffff01ffffff00ff040108ff00ff04ff08ffffffffffffffffff02ffff'
+    'ffffffffffffffffff01ffffff00ffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffff01ffffff00ff02ffffffffffffffffff00ff01'
+    'ffffff0808ff08ff08ffff080002ffffff08ffffff08ff080001ff08ff08ff03'
+    'ffffff08ffffff00ff08ffffffffffffffff0800ff08ffff0800ffff0805ff05'
+    'ff08ff08ff05ff08ffff050805ffff08ff0805ffffffffffffffffffffffff02'
+    'ffffffffffffffffffffff01ffffff00ffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffff01ffffff08ff02ffffffffffffffff0408'
+    'ff01ffff040808ffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffff02ffffffffffffffffffffff01ffffff00ffffffff08ffffff08'
+    'ff08ffffffffffffffff0808ff08ffff080003ffffffffffffffffff02ffffff'
+    'ffffffffffffffff01ffffff00ffff08ff08ffff080808ffffff08ffffff08ff'
+    '080808ff08ff08ff08ff08ff01ffff020002ffffff01ffffff00ff030808ff08'
+    'ff04ff03ffffff08ffffff00ff02ffffffffffffffff0408ff08ffff0800ffff'
+    '0404ff04ff04ff04ff04ff04ffff040404ffff08ff0404ffffffffffff01ffff'
+    'ff00ff02ffffffffffffffffff08ff01ffffff0808ffffffffffffffffff02ff'
+    'ffffffffffffffffffff01ffffff00ffff00ff01ffffff0002ffffffffffffff'
+    'ffffff0108ffffffffff08ff0303ff03ff08ff03ff03ff08ffff030303ffff03'
+    'ff0803ffffffff00ff08ffff0800ffffffff08ffffff00ff0800ffff08ff08ff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff0001ff'
+    '04ff04ff02ff00ff03ffff030004ffff04ff0404ffffffff01ff04ffff040004'
+    'ffffff04ffffff04ff050404ff04ff04ff04ffff01ff0002ffffffff0001ff00'
+    'ffffff08ffffffffff04ffffffff01ff01ffffff0008ffffff03ffffff00ff03'
+    '0001ffffffffff03ffffff01ffffff05ff05ffffffffffffffff0500ff01ffff'
+    'ff0005ff0001ffffffffff08ff00ffffffffff0008ffff01ffffffffffffffff'
+    '02ff0002ffffffff0001ff00ff03ff03ffffffffffffffffffff0202ff00ff02'
+    'ff02ff00ff08ffff080005ffffffffffffffffffffffffffff02ffffffffff01'
+    'ff00ffffffffffffffffffffffffffff00ff01ffff030004ffffff03ffffff08'
+    'ff030404ff04ff04ff04ffffff04ffffff04ff02ffffffffffffffff0404ff04'
+    'ffff040404ff0001ff00ffffff08ff00ffffffffff0808ffff04ff0404ffffff'
+    'ffffff03ffffff03ff03ffffffffffffffff0300ff01ffffff0003ffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffff00ffffffffff0008ff'
+    'ffffffffffff00ffff0001ffffffffff08ff0202ff00ff02ff02ff08ff08ffff'
+    '030808ffffffffffffffffffff00ff01ffff020202ffffff08ffffff08ff08ff'
+    'ffffffffffffffffff02ff0002ffffffff0001ff00ffffff08ffffffffffffff'
+    'ffffffff01ff0002ffffffff0101ff00ff04ff03ffffffffff04ffffffff0102'
+    'ff04ff04ff02ff00ff01ffff040004ffff01ff0404ffffffffffffffff02ffff'
+    'ffffff01ff00ffffffffffffffffffffffffffff0001ffffffffff08ff01ff01'
+    'ffffff0008ffff01ffffffffffffff01ff01ffffff0008ffffff01ffffff00ff'
+    '080108ffffffffff08ffff01ffffffffffffff0001ffffffffff08ffffffffff'
+    'ffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffff'
+    'ff02ff0202ffffffff0001ff00ff08ff08ffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffff02ff0002ffffffff00'
+    '01ff00ff06ff04ffffffffff06ffffffff0406ff00ff04ff04ff04ff04ffff08'
+    '0404ffff04ff0406ffffffffffffffff02ffffffffff01ff00ffffffffffffff'
+    'ffffffffffffff0001ff00ff03ff02ff00ff03ffff060003ffff03ff0308ffff'
+    'ffff00ff02ffff050002ffffff01ffffff00ff050001ff05ff05ff05ffff01ff'
+    '0002ffffffff0001ff00ff06ff05ffffffffff08ffffffffffffffff02ffffff'
+    'ffff01ff00ffffffffffffffffffffffffffffff01ff0002ffffffff0101ff00'
+    'ff08ffffffffffffff06ffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffff0404ff00ff03ff04ff08ff03ffff080404ffff03ff0306'
+    'ffffffff04ff02ffff040404ffffff01ffffff04ff040001ff04ff04ff04ffff'
+    '02ff0202ffffffff0001ff00ff06ff04ffffffffff04ffffffff00ff02ffff03'
+    '0002ffffff01ffffff00ff030001ff03ff03ff03ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffff0208ff06ff06ff02ff00ff06ffff0600'
+    '06ffff08ff0008ffffffffff01ff0202ffffffff0101ff00ff08ffffffffffff'
+    'ff06ffffffff0001ff06ff08ffffff01ff08ffff08ffffffff06ff0606ffffff'
+    'ffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffffffffffff'
+    '02ffffffffff01ff00ffffffffffffffffffffffffffffff01ff0002ffffffff'
+    '0001ff00ff04ff04ffffffffff06ffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffff01ff0002ffffffff0001ff00ff06ff03ffff'
+    'ffffff08ffffffff0001ff08ff02ff02ff06ff06ffff060006ffff06ff0808ff'
+    'ffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff02ffff'
+    'ffffff01ff00ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffff0001ff00ff02ff03ff04ff04ffff040404'
+    'ffff03ff0003ffffffff00ff04ffff0200ffffffff04ffffff04ff0400ffff00'
+    'ff04ffffffff02ff0202ffffffff0001ff00ff04ff04ffffffffff04ffffffff'
+    '00ff02ffff020002ffffffffffffffffffff0001ff00ff03ff03ffffff01ffff'
+    'ff00ff02ffffffffffffffffff00ff05ffff0500ffff0001ff02ff02ff02ffff'
+    'ffffffffffffffffff08ff0008ffffffffff01ff0002ffffffff0101ff00ff08'
+    'ffffffffffffff03ffffffff00ffff00ff08ffffff00ff01ffff08ffffffffff'
+    'ff00ffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffff'
+    'ffff04ff02ffff020404ffffff01ffffff04ff040303ff00ff03ff03ffffff04'
+    'ffffff04ff04ffffffffffffffff0400ff04ffff0400ffff0202ff02ff02ff04'
+    'ff00ff01ffff040404ffff01ff0004ffffffffffff01ffffff00ff02ffffffff'
+    'ffffffffff03ff03ffff030003ffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffff02ff02ffff020002ffffffffffffffffffff0008ff00ff'
+    '08ff08ff0101ff00ff08ffffff01ff08ffff08ffffffff03ff0003ffffffff00'
+    'ff01ffff08ffffffffff01ffffffffffff00ffff00ff08ffffffff01ff0202ff'
+    'ffffff0101ff00ff08ffffffffffffff08ffffffffff01ff0002ffffffff0001'
+    'ff00ff04ff03ffffffffff03ffffffff00ffff00ff02ffffff00ff04ffff0400'
+    'ffffffffff00ffffffffffffffffff02ffffffffff01ff00ffffffffffffffff'
+    'ffffffffffff0001ff02ff02ff02ffffffffffffffffffffff03ff0808ffffff'
+    'ff00ff02ffff0200ffffffffffffffffffffff00ffff08ff08ffffffff01ff00'
+    '02ffffffffffffffffffffffffffffffffff08ffffffffffffffff02ffffffff'
+    'ff01ff00ffffffffffffffffffffffffffffffffff00ffffffffff00ffff00ff'
+    '08ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffff'
+    'ffffffff01ff0802ffffffff0801ff08ff08ff04ffffffffff04ffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffff08ff0808ffff'
+    'ffff0808ff00ff03ff08ffffffffff08ffffffff0508ff08ff05ff05ff08ff05'
+    'ffff080508ffff05ff0508ffffffffffffffff02ffffffffff01ff00ffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff08ff0802'
+    'ffffffff0808ff08ff08ff08ffffffffff03ffffffff0404ff04ff04ff04ff08'
+    'ff04ffff080404ffff04ff0404ffffffffffffffff02ffffffffff01ff00ffff'
+    'ffffffffffffffffffffffff0308ff03ff03ff03ff08ff03ffff030308ffff03'
+    'ff0308ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff08ff0008ffffffff0808ff00ffffff08ffffffffff08ffffffffffffff'
+    'ff02ffffffffff01ff00ffffffffffffffffffffffffffffff01ff0002ffffff'
+    'ff0801ff08ff08ffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff02ffffffffff01ff00ffffffffffffffffffffffffffffff08ff0808ff'
+    'ffffff0808ff08ff08ff08ffffffffff08ffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ff04ff02ffff040204ffffff01ffffff00ff030001ff04ff07ff03ffffff02ff'
+    'ffff04ff02ffffffffffffffff0400ff01ffff040004ff0204ff04ff06ff02ff'
+    '00ff05ffff050004ffff04ff0404ffffffffffff02ffffff00ff02ffffffffff'
+    'ffffff0300ff01ffff0700ffffffffffffffffffff02ffffffffffffffffffff'
+    'ff01ffffff00ffff00ff06ffff0600ffffffff06ffffff00ff0500ffff00ff07'
+    'ffffff0001ff00ff02ff07ff05ff05ffff050505ffff06ff0603ffffffff00ff'
+    '01ffff020706ffffff05ffffff07ff050606ff06ff06ff06ffff05ff0502ffff'
+    'ffff0505ff05ff05ff05ffffffffff05ffffffffffff02ffffff02ff02ffffff'
+    'ffffffffffff00ff01ffff060004ffffffffffffffffff02ffffffffffffffff'
+    'ffffff01ffffff00ffff02ff02ffff060002ffffffffffffffffffff0004ff06'
+    'ff06ff04ffffffffffffffffff02ffffffffffffffffffffff01ffffff00ffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff02ffff'
+    'ff00ff02ffffffffffffffffff00ff01ffff0600ffff02ff02ffff020202ffff'
+    'ffffffffffffffff0601ff06ff06ff03ffffff02ffffff02ff02ffffffffffff'
+    'ffffff00ff01ffff060006ff0202ff02ff02ff02ffffffffffffffffffffff06'
+    'ff0606ffffffff0404ff04ff07ff03ff04ff06ffff030404ffff03ff0304ffff'
+    'ffff00ff01ffff040002ffffff04ffffff04ff060001ff00ff07ff04ffff04ff'
+    '0404ffffffff0404ff00ff04ff04ffffffffff04ffffffff00ff06ffff0700ff'
+    'ffffff06ffffff00ff0600ffff00ff07ffffffffff01ffffff00ff02ffffffff'
+    'ffffffff0600ff01ffff0700ffff00ffff00ff06ffffff00ff06ffff0600ffff'
+    'ffffff00ffffffffffff03ff0302ffffffff0301ff03ff03ff03ffffffffff03'
+    'ffffffff0606ff00ff02ff06ff00ff01ffff060707ffff06ff0606ffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff01ffffff'
+    '00ff02ffffffffffffffff0300ff07ffff070003ffffffffffffffffff02ffff'
+    'ffffffffffffffffff01ffffff00ffff00ff01ffff020002ffffff01ffffff00'
+    'ff040001ff07ff07ff04ffffffffffffffffff02ffffffffffffffffffffff01'
+    'ffffff00ffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff01ffffff00ff02ffffffffffffffffff00ff07ffff0700ffff07ff02ff'
+    'ff070707ffffff01ffffff07ff050001ff07ff07ff03ffffff07ffffff07ff07'
+    'ffffffffffffffff0700ff07ffff0700ffff0505ff05ff05ff07ff05ff05ffff'
+    '050505ffff07ff0705ffffffffffffffffffffffff02ffffffffffffffffffff'
+    'ff01ffffff00ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffff01ffffff00ff02ffffffffffffffffff07ff07ffff070004ffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff02ffffff'
+    'ffffffffffffffff01ffffff00ffffffff01ffffff07ff02ffffffffffffffff'
+    'ff07ff07ffff070707ffffffffffffffffff02ffffffffffffffffffffff01ff'
+    'ffff00ffff00ff01ffff020207ffffffffffffffffffff0707ff07ff07ff07ff'
+    '00ff02ffff070002ffffff01ffffff00ff030001ff00ff07ff03ffffff07ffff'
+    'ff00ff02ffffffffffffffff0400ff07ffff0700ffff0404ff04ff04ff04ff04'
+    'ff04ffff040404ffff04ff0404ffffffffffff01ffffff00ff02ffffffffffff'
+    'ffffff00ff07ffff0700ffffffffffffffffffff02ffffffffffffffffffffff'
+    '01ffffff00ffff00ff01ffff0200ffffffffffffffffffffff00ffff00ff07ff'
+    'ffff0303ff03ff07ff03ff03ff07ffff030703ffff03ff0303ffffffff00ff07'
+    'ffff0700ffffffff07ffffff07ff0700ffff00ff07ffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffff0001ff00ff03ff02ff00ff05ff'
+    'ff030003ffff04ff0404ffffffff04ff05ffff040404ffffff05ffffff05ff05'
+    '0404ff04ff04ff04ffff01ff0002ffffffff0001ff00ffffff04ffffffffff04'
+    'ffffffff00ff03ffff0300ffffffff03ffffff00ff0500ffff00ff03ffffffff'
+    'ff05ffffff00ff05ffffffffffffffff0500ff01ffff0500ffff00ffff00ffff'
+    'ffffff00ffffffffff00ffffffffff00ffffffffffff02ff0202ffffffff0001'
+    'ff00ff05ff05ffffffffffffffffffff0201ff02ff02ff02ff05ff05ffff0505'
+    '07ffffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffff'
+    'ffffffffffff00ff02ffff020002ffffffffffffffffffff0404ff00ff03ff04'
+    'ffffff01ffffff00ff02ffffffffffffffffff04ff04ffff040404ff0001ff00'
+    'ffffff02ffffffffffffffffffffff04ff0004ffffffffffff03ffffff00ff02'
+    'ffffffffffffffffff00ff03ffff0300ffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffff00ffffffffff00ffffffffffffffffffffff00'
+    'ffff00ffffffffff0202ff02ff02ff02ffffffffffffffffffffffffffffffff'
+    'ffffff02ff02ffff020202ffffffffffffffffffffffffffffffffffffffff02'
+    'ff0202ffffffffffffffffffffffffffffffffffffffffffffff01ff0002ffff'
+    'ffff0001ff00ff03ff04ffffffffff04ffffffff0004ff00ff02ff04ff00ff01'
+    'ffff040004ffff04ff0404ffffffffffffffff02ffffffffff01ff00ffffffff'
+    'ffffffffffffffffffff00ffff00ff07ffffff00ff03ffff0300ffffffffff00'
+    'ffffffffff00ff01ffff0700ffffffff01ffffff00ff0700ffff00ff07ffffff'
+    'ffffff00ffffffffff00ffff00ffffffffffffffffffffffffffffffffffff02'
+    'ffffffffff01ff00ffffffffffffffffffffffffffffff02ff0202ffffffff00'
+    '01ff00ff07ff07ffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffff06ffffff06ff02ffffffffffffffff0300ff'
+    '01ffff030003ffffffffffffffffff02ffffffffffffffffffffff01ffffff00'
+    'ffff06ff06ffff060002ffffff06ffffff00ff050001ff00ff04ff04ffffffff'
+    'ffffffffff02ffffffffffffffffffffff01ffffff00ffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffff06ffffff00ff06ffffffff'
+    'ffffffff0600ff01ffffff00ffff06ff02ffff060206ffffff01ffffff00ff03'
+    '0606ff06ff06ff06ffffff06ffffff06ff02ffffffffffffffff0506ff06ffff'
+    '060606ff0505ff05ff06ff05ff05ff05ffff050505ffff06ff0605ffffffffff'
+    'ffffffffffffff02ffffffffffffffffffffff01ffffff00ffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffff06ffffff00ff02ffff'
+    'ffffffffffffff06ff06ffff060004ffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffff02ffffffffffffffffffffff01ffffff00ff'
+    'ffffff01ffffff00ff02ffffffffffffffffff06ff06ffff060606ffffffffff'
+    'ffffffff02ffffffffffffffffffffff01ffffff00ffff00ff02ffff060002ff'
+    'ffffffffffffffffff0606ff06ff06ff06ff00ff01ffff020002ffffff06ffff'
+    'ff06ff060001ff00ff03ff03ffffff06ffffff06ff06ffffffffffffffff0600'
+    'ff01ffff040004ff0404ff04ff04ff04ff04ff06ffff040404ffff04ff0404ff'
+    'ffffffffff01ffffff00ff06ffffffffffffffff0600ff01ffffff00ffffffff'
+    'ffffffffffff02ffffffffffffffffffffff01ffffff00ffff00ff01ffffff00'
+    'ffffffff06ffffff00ff0600ffffffffffffffff0603ff03ff06ff06ff03ff06'
+    'ffff030603ffff06ff0603ffffffff06ff06ffff060606ffffff06ffffff06ff'
+    '060606ff06ff06ff06ffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff00ff'
+    '01ffff030004ffffff03ffffff05ff050404ff04ff04ff04ffffff02ffffff02'
+    'ff02ffffffffffffffff0500ff01ffff040004ff0004ff00ffffff02ff00ffff'
+    'ffffff0004ffff04ff0404ffffffffffff01ffffff00ff02ffffffffffffffff'
+    '0300ff01ffffff00ffffffffffffffffffff02ffffffffffffffffffffff01ff'
+    'ffff00ffff00ffffffffff00ffffffffffffffff00ffff00ffffffffffffffff'
+    '0202ff00ff02ff02ff05ff05ffff030505ffffffffffffffffffff02ff02ffff'
+    '020202ffffff05ffffff05ff05ffffffffffffffffffff01ff0002ffffffff05'
+    '05ff00ffffff05ffffffffffffffffffffffff02ffffff02ff02ffffffffffff'
+    'ffffff00ff01ffff030004ffffffffffffffffff02ffffffffffffffffffffff'
+    '01ffffff00ffff00ffffffffff0002ffffffffffffffffffff0004ff00ffffff'
+    '04ffffffffffffffffff02ffffffffffffffffffffff01ffffff00ffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff00ff'
+    'ffffffffffffffffffff00ffffffffff00ffff02ff02ffff020202ffffffffff'
+    'ffffffffffffffffffffffffffffffff02ffffff02ff02ffffffffffffffffff'
+    'ffffffffffffffffff0202ff00ffffff02ffffffffffffffffffffffffffffff'
+    'ffffffff0404ff04ff04ff04ff03ff03ffff030004ffff04ff0404ffffffff00'
+    'ff01ffff040004ffffff01ffffff00ff040404ff04ff04ff04ffff04ff0404ff'
+    'ffffff0004ff00ffffff04ffffffffff04ffffffff00ff01ffffff00ffffffff'
+    '03ffffff00ff0300ffffffffffffffffffff01ffffff00ff02ffffffffffffff'
+    'ffff00ff01ffffff00ffff00ffffffffffffffff00ffffffffff00ffffffffff'
+    'ffffffffffffff01ff0002ffffffff0303ff03ff03ff03ffffffffffffffffff'
+    'ff0202ff02ff02ff02ff00ff01ffffff00ffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffff0204ff00ff02ff04ff'
+    '00ff04ffff050404ffff03ff0004ffffffff04ff05ffff020404ffffff05ffff'
+    'ff04ff040001ff00ff04ff04ffff01ff0002ffffffff0001ff00ff05ff04ffff'
+    'ffffff04ffffffff00ff02ffff0200ffffffff01ffffff00ff0300ffff00ff03'
+    'ffffffffff05ffffff00ff02ffffffffffffffff0500ff05ffff0500ffff00ff'
+    'ff00ff06ffffff00ff05ffff0600ffffffffff00ffffffffffff01ff0202ffff'
+    'ffff0101ff00ff05ffffffffffffff06ffffffff0101ff00ff02ffffff01ff05'
+    'ffff05ffffffff06ff0606ffffffffffffffff02ffffffffff01ff00ffffffff'
+    'ffffffffffffffffffff00ff02ffff020204ffffffffffffffffffff0404ff00'
+    'ff03ff04ffffff01ffffff04ff02ffffffffffffffffff04ff04ffff040404ff'
+    '0001ff02ff02ff02ffffffffffffffffffffff04ff0004ffffffffffff01ffff'
+    'ff00ff02ffffffffffffffffff00ff03ffff0300ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffff00ff02ffff0600ffffffffffffffff'
+    'ffffff00ffff00ff06ffffff0201ff02ff02ffffffffffffffffffffffffff01'
+    'ff0606ffffffff01ff02ffff02ffffffffffffffffffffffff0001ff06ff06ff'
+    'ffffff02ff0202ffffffffffffffffffffffffffffffffff06ffffffffff01ff'
+    '0002ffffffff0001ff00ff03ff04ffffffffff03ffffffff0001ff00ff02ff04'
+    'ff00ff01ffff040404ffff01ff0004ffffffffffffffff02ffffffffff01ff00'
+    'ffffffffffffffffffffffffffff00ffff00ff02ffffff00ff06ffff0600ffff'
+    'ffffff00ffffffffff00ff01ffff0200ffffffff06ffffff00ff0600ffff00ff'
+    '06ffffffffffff00ffffffffff00ffff00ff06ffffffffffffffffffffffffff'
+    'ffffff02ffffffffff01ff00ffffffffffffffffffffffffffffff01ff0002ff'
+    'ffffff0101ff00ff06ffffffffffffff06ffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffff04ff02ffff020404ffffff01ffffff04'
+    'ff040001ff00ff03ff03ffffff01ffffff00ff02ffffffffffffffff0400ff01'
+    'ffff0400ffff0204ff02ff02ff04ff00ff01ffff040404ffff04ff0004ffffff'
+    'ffffff02ffffff00ff02ffffffffffffffffff00ff01ffff0300ffffffffffff'
+    'ffffffff02ffffffffffffffffffffff01ffffff00ffff00ff02ffff0200ffff'
+    'ffffffffffffffffff00ffff00ff05ffffff0101ff00ff02ffffff01ff05ffff'
+    '05ffffffff03ff0003ffffffff01ff01ffff02ffffffffff01ffffffffffff00'
+    'ffff00ff05ffffffff01ff0505ffffffff0501ff05ff05ffffffffffffff05ff'
+    'ffffffffff02ffffff02ff02ffffffffffffffffff01ff01ffff030004ffffff'
+    'ffffffffffff02ffffffffffffffffffffff01ffffff00ffff02ff02ffff0202'
+    '04ffffffffffffffffffff0004ff00ff04ff04ffffffffffffffffff02ffffff'
+    'ffffffffffffffff01ffffff00ffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffff02ffffff00ff02ffffffffffffffffff00ff01ff'
+    'ffff00ffff01ff02ffff02ffffffffffffffffffffffff0101ff00ff03ffffff'
+    'ffff01ffffffffffffffffffffffffffffff01ff01ffffffffffff0201ff02ff'
+    '02ffffffffffffffffffffffffff01ff00ffffffffff0001ff00ff02ff03ff04'
+    'ff04ffff040404ffff01ff0003ffffffff00ff01ffff0200ffffffff04ffffff'
+    '04ff0400ffff00ff04ffffffff04ff0404ffffffff0404ff04ff04ff04ffffff'
+    'ffff04ffffffff00ff02ffff0200ffffffffffffffffffffff00ffff00ff03ff'
+    'ffffffff02ffffff00ff02ffffffffffffffffff00ff01ffffff00ffff00ffff'
+    '00ff02ffffffffffffffffffffffffffffff00ffffffffffff03ff0303ffffff'
+    'ff0001ff03ff03ffffffffffffff03ffffffff00ffff00ff02ffffff01ff01ff'
+    'ffffffffffffffff00ffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffff01ff0002ffffffff0001ff00ff05ff04ffffffffff04'
+    'ffffffff0104ff00ff05ff04ff00ff05ffff050404ffff04ff0404ffffffffff'
+    'ffffff02ffffffffff01ff00ffffffffffffffffffffffffffff00ffff00ff03'
+    'ffffff00ff05ffff0300ffffffffff00ffffffffff00ff05ffff0500ffffffff'
+    '05ffffff00ff0500ffff00ff05ffffffffffff00ffffffffff00ffff00ffffff'
+    'ffffffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffff'
+    'ffffffffffffff01ff0202ffffffff0101ff00ff05ffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff0001ff00'
+    'ff02ff02ffffffffffffffffffffff04ff0404ffffffff00ff01ffff020204ff'
+    'ffffffffffffffffff0404ff04ff04ff04ffff01ff0002ffffffffffffffffff'
+    'ffffffffffffffff04ffffffff00ff02ffff0300ffffffffffffffffffffff00'
+    'ffff00ff03ffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff00ffff00ffffffffffffffffffffffffffffffffff00ffffffffffff02'
+    'ff0202ffffffffffffffffffffffffffffffffffffffffffff0201ff02ff02ff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffff02ffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffff02ffffffffff01ff00ffffffff'
+    'ffffffffffffffffffffff01ff0002ffffffff0001ff00ff04ff04ffffffffff'
+    '04ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff00ffffffffff00ffff00ff03ffffffffffffffffffffffff00ffff00ff'
+    '02ffffff00ff01ffffff00ffffffffff00ffffffffffffffffffffffffffffff'
+    'ffff00ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff02ff0202ffffffff0001ff00ff04ff06ffffffffff03ffffffff0606ff'
+    '02ff04ff04ff06ff04ffff040406ffff05ff0005ffffffffffffffff02ffffff'
+    'ffff01ff00ffffffffffffffffffffffffffff0002ff07ff02ff03ff06ff01ff'
+    'ff030306ffff05ff0505ffffffff05ff01ffff020002ffffff01ffffff00ff05'
+    '0505ff05ff05ff05ffff01ff0002ffffffff0001ff00ff06ff06ffffffffff07'
+    'ffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffffff'
+    '01ff0002ffffffff0001ff00ffffff06ffffffffff06ffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffff0003ff06ff04ff03ff06ff'
+    '04ffff030407ffff03ff0406ffffffff04ff04ffff040002ffffff04ffffff04'
+    'ff040001ff04ff04ff04ffff01ff0002ffffffff0001ff00ff04ff04ffffffff'
+    'ff04ffffffff03ff01ffff020203ffffff01ffffff00ff030103ff00ff03ff03'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff0001ff07'
+    'ff06ff02ff06ff06ffff060606ffff01ff0707ffffffffff01ff0002ffffffff'
+    '0001ff00ffffff07ffffffffff06ffffffff0006ff00ffffff06ff00ffffffff'
+    'ff0007ffff06ff0006ffffffffffffffff02ffffffffff01ff00ffffffffffff'
+    'ffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffff'
+    'ffffffff02ff0202ffffffff0001ff00ff04ff06ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffff02ff0202ffff'
+    'ffff0001ff00ff03ff06ffffffffffffffffffff0202ff02ff02ff06ff06ff01'
+    'ffff060606ffffffffffffffffffffffffffff02ffffffffff01ff00ffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffff0001ff02ff'
+    '04ff02ff00ff04ffff040003ffff03ff0505ffffffff00ff04ffff0200ffffff'
+    'ff04ffffff00ff0400ffff00ff04ffffffff02ff0202ffffffff0001ff00ff04'
+    'ff04ffffffffff05ffffffff02ff01ffff020002ffffffffffffffffffff0505'
+    'ff05ff05ff03ffffff01ffffff00ff02ffffffffffffffffff05ff05ffff0500'
+    'ffff0102ff00ff02ff02ffffffffffffffffffffff05ff0705ffffffffff01ff'
+    '0002ffffffff0001ff00ffffff03ffffffffff03ffffffff00ffff00ffffffff'
+    'ff00ffffffffff00ffffffffff00ffffffffffffffffff02ffffffffff01ff00'
+    'ffffffffffffffffffffffffffff03ff04ffff040303ffffff04ffffff04ff04'
+    '0303ff03ff04ff03ffffff04ffffff00ff04ffffffffffffffff0400ff04ffff'
+    '0400ffff0001ff02ff04ff02ff04ff04ffff040404ffff01ff0004ffffffffff'
+    'ff01ffffff00ff02ffffffffffffffffff03ff01ffff030303ffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffff02ff01ffff020202ffffff'
+    'ffffffffffffff0001ff07ff07ff07ff0003ff00ffffff03ff00ffffffffff00'
+    '07ffff03ff0003ffffffff00ffffffffff00ffffffffffffffff00ffff00ffff'
+    '00ffffffffffff01ff0002ffffffff0001ff00ffffff07ffffffffff07ffffff'
+    'ffff02ff0202ffffffff0001ff00ff04ff03ffffffffffffffffffff00ffff00'
+    'ff02ffffff00ff04ffff0400ffffffffffffffffffffffffffffff02ffffffff'
+    'ff01ff00ffffffffffffffffffffffffffff0202ff02ff02ff02ffffffffffff'
+    'ffffffffffffffffffffffffff02ff02ffff0200ffffffffffffffffffffffff'
+    'ffffffffffffffffff02ff0202ffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffffffff'
+    'ff00ffffffffff00ffff00ffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffff02ffffffffff01ff'
+    '00ffffffffffffffffffffffffffffff01ff0002ffffffff0707ff00ff04ff07'
+    'ffffffffff04ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffff07ff0707ffffffff0707ff07ff07ff07ffffffffff07ffffffff'
+    '0505ff07ff05ff05ff07ff05ffff070507ffff05ff0505ffffffffffffffff02'
+    'ffffffffff01ff00ffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffff02ffffffffff01ff00ffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffff07ff0002ffffffff0007ff00ff03ff07ffffffffff03ffff'
+    'ffff0404ff04ff04ff04ff04ff04ffff040407ffff04ff0404ffffffffffffff'
+    'ff02ffffffffff01ff00ffffffffffffffffffffffffffff0307ff07ff03ff03'
+    'ff03ff03ffff030307ffff03ff0307ffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffff07ff0707ffffffff0007ff00ffffff07ff'
+    'ffffffff07ffffffffffffffff02ffffffffff01ff00ffffffffffffffffffff'
+    'ffffffffff01ff0002ffffffff0007ff00ffffff07ffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffff02ffffffffff01'
+    'ff00ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffff'
+    'ffffffffffffff01ff0702ffffffff0707ff07ff07ff07ffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffff0001ff04ff04ff02ff01ff04ffff040003ffff'
+    '05ff0404ffffffff02ff04ffff040006ffffff04ffffff04ff040005ff04ff04'
+    'ff05ffff01ff0002ffffffff0101ff00ff04ff04ffffffffff04ffffffff01ff'
+    '01ffffff0002ffffff01ffffff06ff030105ffffffffff05ffffff01ffffff05'
+    'ff02ffffffffffffffff0505ff01ffffff0505ff0101ffffffffff02ff00ff01'
+    'ffffff0606ffff01ffffffffffffffff02ff0002ffffffff0001ff00ffffff03'
+    'ffffffffff03ffffffff0006ff00ffffff06ff00ffffffffff0006ffff06ff00'
+    '05ffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffff'
+    '01ff04ffff040003ffffff03ffffff03ff040403ff04ff04ff03ffffff04ffff'
+    'ff04ff04ffffffffffffffff0404ff04ffff040004ff0001ff04ff04ff02ff00'
+    'ff01ffff040004ffff01ff0404ffffffffffff01ffffff03ff02ffffffffffff'
+    'ffff0300ff01ffffff0303ffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffff01ff01ffffff0002ffffff06ffffff06ff060101ffffffffff'
+    '06ff0001ff00ffffff02ff00ffffffffff0003ffff06ff0006ffffffff00ffff'
+    'ffffff0006ffffffffffffff00ffff0006ff00ffffff06ffff01ff0002ffffff'
+    'ff0001ff00ffffff06ffffffffff06ffffffffff02ff0202ffffffff0001ff00'
+    'ff04ff06ffffffffffffffffffff0202ff02ff04ff06ff00ff04ffff040606ff'
+    'ffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffff'
+    'ffffffff0102ffffffffff02ff00ff01ffffff0606ffffffffffffffffffff02'
+    'ff01ffffff0202ffffff01ffffff06ff06ffffffffffffffffffff01ffffffff'
+    'ffffff0001ffffffffff06ffffffffffffffffffffffffffff02ffffffffff01'
+    'ff00ffffffffffffffffffffffffffffff02ff0002ffffffff0001ff00ffffff'
+    '06ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffff02ff04ffff040003ffffff04ffffff04ff040005ff04ff04ff03'
+    'ffffff01ffffff00ff02ffffffffffffffff0400ff01ffff0400ffff0405ff04'
+    'ff04ff02ff04ff04ffff040404ffff05ff0405ffffffffffff01ffffff02ff02'
+    'ffffffffffffffffff01ff01ffffff0005ffffffffffffffffff02ffffffffff'
+    'ffffffffffff01ffffff00ffff00ff01ffffff0202ffffffffffffffffffff01'
+    '05ffffffffff05ff0003ff00ffffff03ff00ffffffffff0003ffff03ff0005ff'
+    'ffffff00ffffffffff00ffffffffffffffff00ffff00ffff00ffffffffffff05'
+    'ff0005ffffffff0005ff00ffffff05ffffffffff05ffffffffffff01ffffff00'
+    'ff02ffffffffffffffff0400ff01ffff040003ffffffffffffffffff02ffffff'
+    'ffffffffffffffff01ffffff00ffff01ff04ffff040002ffffff04ffffff04ff'
+    '040001ff04ff04ff04ffffffffffffffffff02ffffffffffffffffffffff01ff'
+    'ffff00ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffff01ffffff02ff02ffffffffffffffffff01ff01ffffff00ffff00ffffffff'
+    'ff0003ffffffffffffff00ffff0003ff00ffffff03ffffffffffffff00ffffff'
+    'ffffffffffffffff00ffffffffff00ffff0001ff00ffffff02ff00ffffffffff'
+    '00ffffff01ff00ffffffffff0002ff02ff04ff02ff04ff04ffff040003ffffff'
+    'ffffffffffffff00ff01ffff0200ffffffff04ffffff00ff04ffffffffffffff'
+    'ffffff01ff0402ffffffff0404ff04ff04ff04ffffffffffffffffffff02ff01'
+    'ffffff0202ffffffffffffffffffffffffffffffffffffffffff02ffffff02ff'
+    '02ffffffffffffffffffffffffffffffffffff0102ffffffffff02ffffffffff'
+    'ffffffffffffffffffffffffffffff03ff0002ffffffff0003ff00ffffff03ff'
+    'ffffffffffffffffff00ffff00ffffffffff00ffffffffff00ffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    '01ff0002ffffffff0101ff00ff04ff03ffffffffff04ffffffff0402ff04ff04'
+    'ff02ff01ff04ffff040004ffff01ff0404ffffffffffffffff02ffffffffff01'
+    'ff00ffffffffffffffffffffffffffff0101ffffffffff02ff01ff01ffffff00'
+    '03ffff01ffffffffffffff00ff01ffffff0505ffffff01ffffff05ff050105ff'
+    'ffffffff05ffff01ffffffffffffff0101ffffffffff05ffffffffffffffffff'
+    'ffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffffff02ff00'
+    '02ffffffff0001ff00ffffff05ffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffff0401ff04ff04ff02ff00ff01ffff'
+    '030003ffff04ff0404ffffffff04ff04ffff040404ffffff04ffffff04ff0404'
+    '04ff04ff04ff04ffff01ff0002ffffffff0001ff00ffffff04ffffffffff04ff'
+    'ffffff00ff01ffffff0303ffffff03ffffff03ff030001ffffffffff03ffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffff0101ffffffffff'
+    '02ff00ffffffffff00ffffff01ffffffffffffffff02ff0002ffffffff0001ff'
+    '00ffffff03ffffffffffffffffffff0002ff00ffffff02ff00ffffffffff00ff'
+    'ffffffffffffffffffffffffffff02ffffffffff01ff00ffffffffffffffffff'
+    'ffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffff'
+    'ff02ff0202ffffffff0101ff00ff04ff04ffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffff01ffffffffffffff01'
+    '01ffffffffff03ffffffffffffffffffff0102ffffffffff02ff01ff01ffffff'
+    '00ffffffffffffffffffffffffffffffffffffffffff01ffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff02ffffff'
+    'ffff01ff00ffffffffffffffffffffffffffffff06ff0606ffffffff0606ff00'
+    'ff04ff06ffffffffff06ffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffff06ff0602ffffffff0606ff06ff06ff06ffffffffff03'
+    'ffffffff0506ff05ff05ff05ff06ff05ffff060506ffff05ff0505ffffffffff'
+    'ffffff02ffffffffff01ff00ffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffff02ffffffffff01'
+    'ff00ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffff06ff0606ffffffff0001ff00ff03ff03ffffffff'
+    'ff06ffffffff0406ff04ff04ff04ff04ff04ffff040404ffff04ff0406ffffff'
+    'ffffffffff02ffffffffff01ff00ffffffffffffffffffffffffffff0306ff06'
+    'ff03ff03ff06ff03ffff060306ffff03ff0306ffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffff06ff0606ffffffff0606ff06ff'
+    '06ff06ffffffffff06ffffffffffffffff02ffffffffff01ff00ffffffffffff'
+    'ffffffffffffffffff06ff0006ffffffff0001ff00ffffffffffffffffff06ff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff02ffff'
+    'ffffff01ff00ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffff02ffffffffff01ff00ffffffff'
+    'ffffffffffffffffffffff06ff0002ffffffff0606ff06ff06ff06ffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffff01ff0002ffffffff0001ff00ff04'
+    'ff03ffffffffff03ffffffff00ffff00ff04ffffff00ff04ffff0400ffffffff'
+    'ff00ffffffffffffffffff02ffffffffff01ff00ffffffffffffffffffffffff'
+    'ffff0001ff02ff02ff02ffffffffffffffffffffff03ff0505ffffffff00ff01'
+    'ffff0200ffffffffffffffffffffff00ffff05ff05ffffffff02ff0202ffffff'
+    'ffffffffffffffffffffffffffff05ffffffffffffffff02ffffffffff01ff00'
+    'ffffffffffffffffffffffffffffffffff00ffffffffff00ffff00ffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffff0001ff00ff04ff03ff04ff04ffff040404ffff03ff0303ffffffff00'
+    'ff04ffff0400ffffffff04ffffff04ff0400ffff00ff04ffffffff02ff0202ff'
+    'ffffff0001ff00ff04ff04ffffffffff04ffffffff00ff01ffff020002ffffff'
+    'ffffffffffffff0303ff03ff03ff03ffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffff0202ff02ff02ff02ffffffffffffffffffffff01ff'
+    '00ffffffffffff01ff0002ffffffff0001ff00ffffffffffffffffff03ffffff'
+    'ff00ffff00ffffffffff00ffffffffffffffffffffff00ffffffffffffffffff'
+    '02ffffffffff01ff00ffffffffffffffffffffffffffffffffffff02ffffffff'
+    'ff01ff00ffffffffffffffffffffffffffffffffff00ffffffffff00ffff00ff'
+    '04ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffff02ff0202ffffffffffffffffffffffffffffffffffffff'
+    'ffffff00ffff02ff02ffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffff02ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    '00ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff'
+)
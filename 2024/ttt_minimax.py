@@ -12,14 +12,55 @@ Key findings:
 - Every game ends in a draw with perfect play
 """
 
+import functools
+import os
+from array import array
 from typing import Optional
 from dataclasses import dataclass
-from functools import lru_cache
+
+try:
+    from perfect_play import BEST_MOVE  # generated by build_tables.py
+except ImportError:
+    BEST_MOVE = None
 
 WINS = [(0,1,2), (3,4,5), (6,7,8),  # rows
         (0,3,6), (1,4,7), (2,5,8),  # columns
         (0,4,8), (2,4,6)]           # diagonals
 
+# Boards are ints in base 3: digit i is cell i, 0 = empty, 1 = X, 2 = O
+EMPTY, X, O = 0, 1, 2
+PIECES = '.XO'
+TURN_PIECE = (O, X)  # piece to move, indexed by is_x_turn
+POW3 = tuple(3 ** i for i in range(9))
+NUM_BOARDS = 3 ** 9
+
+def encode(board: str) -> int:
+    """Convert a 9-character '.XO' board to its base-3 int."""
+    return sum(PIECES.index(c) * p for c, p in zip(board, POW3))
+
+def decode(board: int) -> str:
+    """Convert a base-3 int board back to 9 '.XO' characters."""
+    return ''.join(PIECES[board // p % 3] for p in POW3)
+
+# WINS as 9-bit masks; HAS_LINE[bits] is 1 if bits covers any of them
+LINES = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in WINS)
+HAS_LINE = bytes(any(bits & m == m for m in LINES) for bits in range(1 << 9))
+
+def _winner_table() -> bytes:
+    """WINNER[board] = X, O or EMPTY for every board, without decoding each one."""
+    # Digit i of the board adds cell i's bit to X's mask (digit X) or to
+    # O's mask (digit O), so both mask lists are built one digit at a time
+    x_masks = o_masks = [0]
+    for i in range(9):
+        bit = 1 << i
+        x_masks = x_masks + [m | bit for m in x_masks] + x_masks
+        o_masks = o_masks + o_masks + [m | bit for m in o_masks]
+    return bytes(X if HAS_LINE[xm] else O if HAS_LINE[om] else EMPTY
+                 for xm, om in zip(x_masks, o_masks))
+
+# WINNER[board] is X, O or EMPTY, precomputed for all 3**9 boards
+WINNER = _winner_table()
+
 @dataclass
 class Stats:
     positions_evaluated: int = 0
@@ -27,126 +68,299 @@ class Stats:
     o_wins: int = 0
     draws: int = 0
 
-stats = Stats()
-
-def winner(board: str) -> Optional[str]:
+def winner(board: int) -> Optional[str]:
     """Return 'X', 'O', or None."""
-    for a, b, c in WINS:
-        if board[a] == board[b] == board[c] != '.':
-            return board[a]
-    return None
+    w = WINNER[board]
+    return PIECES[w] if w else None
 
-def is_full(board: str) -> bool:
-    return '.' not in board
+def is_full(board: int) -> bool:
+    return all(board // p % 3 != EMPTY for p in POW3)
+
+UNSOLVED = 0xFF
+
+def _solve_all() -> bytearray:
+    """
+    Solve every legal board bottom-up, most-filled boards first, so each
+    board's children are already known when it is reached.
+    Entries are value + 1 (0 = O wins, 1 = draw, 2 = X wins).  Every
+    board with legal piece counts (X has as many pieces as O, or one
+    more) is solved, including unreachable ones such as play continuing
+    after a win; only boards with impossible counts hold UNSOLVED.
+    """
+    value = bytearray([UNSOLVED]) * NUM_BOARDS
+    # Piece counts for every board, built one digit at a time as in
+    # _winner_table
+    x_counts = o_counts = [0]
+    for _ in range(9):
+        x_counts = x_counts + [c + 1 for c in x_counts] + x_counts
+        o_counts = o_counts + o_counts + [c + 1 for c in o_counts]
+
+    by_filled = [[] for _ in range(10)]
+    for board, (x_count, o_count) in enumerate(zip(x_counts, o_counts)):
+        if x_count - o_count in (0, 1):
+            by_filled[x_count + o_count].append(board)
+
+    for filled in range(9, -1, -1):
+        is_x_turn = filled % 2 == 0
+        piece = TURN_PIECE[is_x_turn]
+        for board in by_filled[filled]:
+            w = WINNER[board]
+            if w == X:
+                value[board] = 2
+            elif w == O:
+                value[board] = 0
+            elif filled == 9:
+                value[board] = 1
+            else:
+                # Running best with a cutoff once the mover's best possible
+                # outcome is found (what alpha-beta gives with a {-1,0,+1} window)
+                best, goal = (0, 2) if is_x_turn else (2, 0)
+                for p in POW3:
+                    if board // p % 3 != EMPTY:
+                        continue
+                    child = value[board + piece * p]
+                    if (child > best) if is_x_turn else (child < best):
+                        best = child
+                        if best == goal:
+                            break
+                value[board] = best
+    return value
+
+def _solve_kernel(winner, value):
+    """
+    _solve_all without Python objects, for Numba: winner and value are
+    uint8 arrays over all boards.  Rescans every board once per fill
+    level instead of grouping them first, which is cheap once compiled.
+    """
+    n = value.shape[0]
+    for filled in range(9, -1, -1):
+        is_x_turn = filled % 2 == 0
+        piece = 1 if is_x_turn else 2
+        for board in range(n):
+            x_count = o_count = 0
+            rest = board
+            for _ in range(9):
+                cell = rest % 3
+                rest //= 3
+                if cell == 1:
+                    x_count += 1
+                elif cell == 2:
+                    o_count += 1
+            if x_count + o_count != filled or not 0 <= x_count - o_count <= 1:
+                continue
 
-@lru_cache(maxsize=None)
-def minimax(board: str, is_x_turn: bool) -> int:
+            w = winner[board]
+            if w == 1:
+                value[board] = 2
+            elif w == 2:
+                value[board] = 0
+            elif filled == 9:
+                value[board] = 1
+            else:
+                best = 0 if is_x_turn else 2
+                goal = 2 - best
+                rest = board
+                p = 1
+                for _ in range(9):
+                    if rest % 3 == 0:
+                        child = value[board + piece * p]
+                        if is_x_turn:
+                            best = max(best, child)
+                        else:
+                            best = min(best, child)
+                        if best == goal:
+                            break
+                    rest //= 3
+                    p *= 3
+                value[board] = best
+
+def _solve_all_jit() -> bytearray:
+    """Fill the table with _solve_kernel compiled by Numba."""
+    import numpy as np
+    from numba import njit
+
+    value = bytearray([UNSOLVED]) * NUM_BOARDS
+    njit(cache=True)(_solve_kernel)(np.frombuffer(WINNER, np.uint8),
+                                    np.frombuffer(value, np.uint8))
+    return value
+
+# Importing Numba costs more than the pure-Python solve of 3**9 boards,
+# so the compiled kernel is opt-in (TTT_NUMBA=1)
+USE_NUMBA = os.environ.get('TTT_NUMBA') == '1'
+
+@functools.cache
+def value_table() -> bytearray:
+    """
+    value_table()[board] - 1 is the minimax value of every board with
+    legal piece counts.  Solved on first use, so play through the
+    perfect_play table never pays for it.  With TTT_NUMBA=1 but no
+    NumPy/Numba installed, the pure-Python solve is used.
+    """
+    if USE_NUMBA:
+        try:
+            return _solve_all_jit()
+        except ImportError:
+            pass
+    return _solve_all()
+
+def table_stats() -> Stats:
     """
-    Minimax with memoization.
+    Tally solved boards and terminal outcomes in the table.
+    Done on request rather than at import, since play never needs it.
+    """
+    stats = Stats()
+    for board, v in enumerate(value_table()):
+        if v == UNSOLVED:
+            continue
+        stats.positions_evaluated += 1
+        w = WINNER[board]
+        if w == X:
+            stats.x_wins += 1
+        elif w == O:
+            stats.o_wins += 1
+        elif is_full(board):
+            stats.draws += 1
+    return stats
+
+def minimax(board: int, is_x_turn: bool) -> int:
+    """
+    Minimax value, read from the precomputed table.
     Returns: +1 for X win, -1 for O win, 0 for draw
+    The side to move follows from the board, so is_x_turn must agree
+    with it (X moves when both have the same number of pieces).
+    Raises ValueError if the piece counts are impossible.
     """
-    stats.positions_evaluated += 1
-
-    w = winner(board)
-    if w == 'X':
-        stats.x_wins += 1
-        return 1
-    if w == 'O':
-        stats.o_wins += 1
-        return -1
-    if is_full(board):
-        stats.draws += 1
-        return 0
+    value = value_table()[board]
+    if value == UNSOLVED:
+        raise ValueError(f"impossible piece counts: {decode(board)}")
+    return value - 1
 
-    moves = [i for i in range(9) if board[i] == '.']
-    scores = []
+NO_MOVE = 0xFF  # BEST_MOVE entry for finished or impossible boards
 
-    for move in moves:
-        new_board = board[:move] + ('X' if is_x_turn else 'O') + board[move+1:]
-        scores.append(minimax(new_board, not is_x_turn))
+def x_to_move(board: int) -> bool:
+    """True if X is to move, i.e. both sides have the same number of pieces."""
+    cells = [board // p % 3 for p in POW3]
+    return cells.count(X) == cells.count(O)
 
-    return max(scores) if is_x_turn else min(scores)
+def best_move(board: int, is_x_turn: bool) -> int:
+    """
+    Find the optimal move, or -1 if the game is over (or the board is
+    impossible).  As with minimax, the side to move follows from the
+    board, so is_x_turn must agree with it; both the BEST_MOVE table and
+    the search fallback answer for the side the board says is to move.
+    """
+    if BEST_MOVE is not None:
+        move = BEST_MOVE[board]
+        return -1 if move == NO_MOVE else move
+    if WINNER[board] or value_table()[board] == UNSOLVED:
+        return -1
+    return search_best_move(board, x_to_move(board))
 
-def best_move(board: str, is_x_turn: bool) -> int:
-    """Find the optimal move."""
-    player = 'X' if is_x_turn else 'O'
+def search_best_move(board: int, is_x_turn: bool) -> int:
+    """Find the optimal move by scoring each child in the value table."""
+    value = value_table()
+    piece = TURN_PIECE[is_x_turn]
     best_score = -2 if is_x_turn else 2
     best_m = -1
 
-    for i in range(9):
-        if board[i] == '.':
-            new_board = board[:i] + player + board[i+1:]
-            score = minimax(new_board, not is_x_turn)
-            if is_x_turn and score > best_score:
-                best_score, best_m = score, i
-            elif not is_x_turn and score < best_score:
-                best_score, best_m = score, i
+    goal = 1 if is_x_turn else -1
+
+    for i, p in enumerate(POW3):
+        if board // p % 3 != EMPTY:
+            continue
+        score = value[board + piece * p] - 1
+        if is_x_turn and score > best_score:
+            best_score, best_m = score, i
+        elif not is_x_turn and score < best_score:
+            best_score, best_m = score, i
+        if best_score == goal:
+            break  # nothing can beat a forced win
 
     return best_m
 
 def count_unique_positions():
     """Count all unique reachable board positions."""
-    positions = set()
-
-    def explore(board: str, is_x_turn: bool):
-        if board in positions:
-            return
-        positions.add(board)
-
-        if winner(board) or is_full(board):
-            return
-
-        for i in range(9):
-            if board[i] == '.':
-                new_board = board[:i] + ('X' if is_x_turn else 'O') + board[i+1:]
-                explore(new_board, not is_x_turn)
-
-    explore('.' * 9, True)
-    return len(positions)
-
-def canonical_form(board: str) -> str:
+    visited = bytearray(NUM_BOARDS)
+    count = 0
+    stack = [(0, True)]
+
+    while stack:
+        board, is_x_turn = stack.pop()
+        if visited[board]:
+            continue
+        visited[board] = 1
+        count += 1
+
+        if WINNER[board]:
+            continue
+
+        piece = TURN_PIECE[is_x_turn]
+        for p in POW3:
+            if board // p % 3 == EMPTY:
+                stack.append((board + piece * p, not is_x_turn))
+
+    return count
+
+ROTATE = (6, 3, 0, 7, 4, 1, 8, 5, 2)
+REFLECT = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+
+def _symmetries() -> list:
+    """The 8 board symmetries as index tuples: form[j] = board[perm[j]]."""
+    perms = []
+    for start in (tuple(range(9)), REFLECT):
+        perm = start
+        for _ in range(4):
+            perms.append(perm)
+            perm = tuple(perm[i] for i in ROTATE)
+    return perms
+
+SYMS = _symmetries()
+
+@functools.cache
+def canon_table() -> array:
+    """canon_table()[board] = smallest board int among the 8 symmetric forms.
+    Built on first use; only the symmetry count needs it."""
+    images = []
+    for perm in SYMS:
+        # Digit i of board lands at position perm.index(i) of the form
+        weights = [POW3[perm.index(i)] for i in range(9)]
+        vals = [0]
+        for w in weights:
+            vals = [v + d * w for d in (EMPTY, X, O) for v in vals]
+        images.append(vals)
+    return array('H', map(min, zip(*images)))
+
+def canonical_form(board: int) -> int:
     """Return the canonical form under 8-fold symmetry (4 rotations x 2 reflections)."""
-    def rotate(b):
-        return b[6] + b[3] + b[0] + b[7] + b[4] + b[1] + b[8] + b[5] + b[2]
-
-    def reflect(b):
-        return b[2] + b[1] + b[0] + b[5] + b[4] + b[3] + b[8] + b[7] + b[6]
-
-    forms = [board]
-    b = board
-    for _ in range(3):
-        b = rotate(b)
-        forms.append(b)
-    b = reflect(board)
-    forms.append(b)
-    for _ in range(3):
-        b = rotate(b)
-        forms.append(b)
-
-    return min(forms)
+    return canon_table()[board]
 
 def count_symmetric_positions():
     """Count positions with symmetry reduction."""
-    positions = set()
-
-    def explore(board: str, is_x_turn: bool):
-        canon = canonical_form(board)
-        if canon in positions:
-            return
-        positions.add(canon)
-
-        if winner(board) or is_full(board):
-            return
-
-        for i in range(9):
-            if board[i] == '.':
-                new_board = board[:i] + ('X' if is_x_turn else 'O') + board[i+1:]
-                explore(new_board, not is_x_turn)
-
-    explore('.' * 9, True)
-    return len(positions)
-
-def show_board(board: str):
+    canon_of = canon_table()
+    visited = bytearray(NUM_BOARDS)
+    count = 0
+    stack = [(0, True)]
+
+    while stack:
+        board, is_x_turn = stack.pop()
+        canon = canon_of[board]
+        if visited[canon]:
+            continue
+        visited[canon] = 1
+        count += 1
+
+        if WINNER[board]:
+            continue
+
+        piece = TURN_PIECE[is_x_turn]
+        for p in POW3:
+            if board // p % 3 == EMPTY:
+                stack.append((board + piece * p, not is_x_turn))
+
+    return count
+
+def show_board(board: int):
+    board = decode(board)
     print()
     for i in range(3):
         row = ' | '.join(board[i*3:(i+1)*3].replace('.', ' '))
@@ -166,7 +380,7 @@ def play_game():
     print("-----------")
     print(" 7 | 8 | 9\n")
 
-    board = '.' * 9
+    board = 0
     is_x_turn = True
 
     while True:
@@ -182,17 +396,17 @@ def play_game():
         if is_x_turn:
             try:
                 move = int(input("Your move (1-9): ")) - 1
-                if move < 0 or move > 8 or board[move] != '.':
+                if move < 0 or move > 8 or board // POW3[move] % 3 != EMPTY:
                     print("Invalid move")
                     continue
             except (ValueError, EOFError):
                 print("Invalid input")
                 continue
-            board = board[:move] + 'X' + board[move+1:]
+            board += X * POW3[move]
         else:
             move = best_move(board, False)
             print(f"Computer plays: {move + 1}")
-            board = board[:move] + 'O' + board[move+1:]
+            board += O * POW3[move]
 
         is_x_turn = not is_x_turn
 
@@ -209,12 +423,13 @@ if __name__ == "__main__":
 
     # Verify perfect play leads to draw
     print("\nVerifying optimal play from start...")
-    result = minimax('.' * 9, True)
+    result = minimax(0, True)
     print(f"Minimax result from empty board: {result}")
     print(f"  (0 = draw, +1 = X wins, -1 = O wins)")
 
-    cache_info = minimax.cache_info()
-    print(f"\nPositions in cache: {cache_info.currsize}")
+    # Includes unreachable boards, e.g. play continuing after a win
+    print(f"\nBoards with legal piece counts (solved in table): "
+          f"{table_stats().positions_evaluated:,}")
 
     print("\n" + "="*50)
     print("Comparison with Unix V4 (1973):")
@@ -8,8 +8,15 @@ decode the format and visualize what the AI has learned.
 
 import struct
 import sys
+from collections import Counter
+from itertools import product
 from pathlib import Path
 
+def _iter_records(fmt: str, data: bytes):
+    """Unpack consecutive fixed-size records, ignoring a trailing partial one."""
+    size = struct.calcsize(fmt)
+    return struct.iter_unpack(fmt, data[:len(data) - len(data) % size])
+
 def analyze_bytes(data: bytes):
     """Analyze byte patterns in the knowledge file."""
     print(f"=== Knowledge File Analysis ===")
@@ -18,13 +25,8 @@ def analyze_bytes(data: bytes):
 
     # Look for patterns
     print("=== Byte Frequency ===")
-    freq = {}
-    for b in data:
-        freq[b] = freq.get(b, 0) + 1
-
-    # Sort by frequency
-    sorted_freq = sorted(freq.items(), key=lambda x: -x[1])[:20]
-    for byte, count in sorted_freq:
+    # Most frequent first, ties in order of first appearance
+    for byte, count in Counter(data).most_common(20):
         pct = count / len(data) * 100
         print(f"  0x{byte:02x} ({byte:3d}): {count:3d} times ({pct:5.1f}%)")
 
@@ -32,8 +34,9 @@ def analyze_bytes(data: bytes):
 
     # Value range analysis
     print("=== Value Ranges ===")
-    print(f"  Min byte: {min(data)} (0x{min(data):02x})")
-    print(f"  Max byte: {max(data)} (0x{max(data):02x})")
+    lo, hi = min(data), max(data)
+    print(f"  Min byte: {lo} (0x{lo:02x})")
+    print(f"  Max byte: {hi} (0x{hi:02x})")
     print(f"  Mean: {sum(data)/len(data):.1f}")
     print()
 
@@ -46,33 +49,27 @@ def analyze_bytes(data: bytes):
 
     print()
 
+# Each cell: 0=empty, 1=X, 2=O
+# 9 cells, 3^9 = 19683, fits in 16 bits
+NUM_BOARDS = 3 ** 9
+
+# BOARD_STR[value] is the board drawn most-significant cell first, e.g. "X.O|...|..X"
+BOARD_STR = [f"{a}{b}{c}|{d}{e}{f}|{g}{h}{i}"
+             for a, b, c, d, e, f, g, h, i in product('.XO', repeat=9)]
+
 def try_decode_board(value: int) -> str:
     """Try to decode a 16-bit value as a board state."""
-    # Each cell: 0=empty, 1=X, 2=O
-    # 9 cells, 3^9 = 19683, fits in 16 bits
-    cells = []
-    for _ in range(9):
-        cells.append(value % 3)
-        value //= 3
-    cells.reverse()
-
-    # Convert to visual
-    symbols = ['.', 'X', 'O']
-    board = [symbols[c] for c in cells]
-    return f"{board[0]}{board[1]}{board[2]}|{board[3]}{board[4]}{board[5]}|{board[6]}{board[7]}{board[8]}"
+    return BOARD_STR[value] if 0 <= value < NUM_BOARDS else '[invalid]'
 
 def interpret_as_2byte_records(data: bytes):
     """Interpret as 2-byte records (board state only)."""
     print("=== Interpretation: 2-byte records ===")
-    records = []
-    for i in range(0, len(data) - 1, 2):
-        val = struct.unpack_from("<H", data, i)[0]
-        records.append(val)
+    records = [val for (val,) in _iter_records("<H", data)]
 
     print(f"Found {len(records)} potential board states")
     print("\nFirst 20 decoded as boards:")
     for i, val in enumerate(records[:20]):
-        if val < 19683:  # Valid board range
+        if val < NUM_BOARDS:  # Valid board range
             board = try_decode_board(val)
             print(f"  {i:3d}: {val:5d} (0x{val:04x}) -> {board}")
         else:
@@ -83,16 +80,12 @@ def interpret_as_3byte_records(data: bytes):
     """Interpret as 3-byte records (board + weight)."""
     print("=== Interpretation: 3-byte records (board + weight) ===")
 
-    records = []
-    for i in range(0, len(data) - 2, 3):
-        board_val = struct.unpack_from("<H", data, i)[0]
-        weight = struct.unpack_from("<b", data, i + 2)[0]  # signed
-        records.append((board_val, weight))
+    records = list(_iter_records("<Hb", data))  # weight is signed
 
     print(f"Found {len(records)} potential (board, weight) pairs")
     print("\nFirst 20 entries:")
     for i, (board_val, weight) in enumerate(records[:20]):
-        if board_val < 19683:
+        if board_val < NUM_BOARDS:
             board = try_decode_board(board_val)
             print(f"  {i:3d}: board={board} weight={weight:+4d}")
         else:
@@ -113,10 +106,7 @@ def interpret_as_4byte_records(data: bytes):
     """Interpret as 4-byte records."""
     print("=== Interpretation: 4-byte records ===")
 
-    records = []
-    for i in range(0, len(data) - 3, 4):
-        val = struct.unpack_from("<I", data, i)[0]
-        records.append(val)
+    records = [val for (val,) in _iter_records("<I", data)]
 
     print(f"Found {len(records)} records")
     print("First 10:")
@@ -124,14 +114,18 @@ def interpret_as_4byte_records(data: bytes):
         print(f"  {i}: 0x{val:08x}")
     print()
 
+# Maps each byte to itself if printable ASCII, else to '.'
+PRINTABLE = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
+
 def hexdump(data: bytes, cols: int = 16, max_lines: int = 20):
     """Pretty hex dump."""
-    print("=== Hex Dump ===")
+    lines = ["=== Hex Dump ==="]
     for i in range(0, min(len(data), cols * max_lines), cols):
         line = data[i:i + cols]
-        hex_part = ' '.join(f'{b:02x}' for b in line)
-        ascii_part = ''.join(chr(b) if 32 <= b < 127 else '.' for b in line)
-        print(f"{i:04x}: {hex_part:<{cols*3}} {ascii_part}")
+        hex_part = line.hex(' ')
+        ascii_part = line.translate(PRINTABLE).decode('ascii')
+        lines.append(f"{i:04x}: {hex_part:<{cols*3}} {ascii_part}")
+    sys.stdout.write("\n".join(lines) + "\n")
     if len(data) > cols * max_lines:
         print(f"... ({len(data) - cols * max_lines} more bytes)")
     print()
@@ -15,10 +15,10 @@ The a.out format for PDP-11:
   0x10    ...   Text segment
 """
 
-import struct
 import sys
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # PDP-11 Addressing Modes
 MODES = [
@@ -89,6 +89,33 @@ OPCODES = {
     0o104400: ("sys", "sys"),
 }
 
+# Opcode dispatch tables, keyed by the bits that select the instruction
+DOUBLE_OP_NAMES = {  # word >> 12
+    0o01: "mov", 0o02: "cmp", 0o03: "bit", 0o04: "bic",
+    0o05: "bis", 0o06: "add", 0o11: "movb", 0o12: "cmpb",
+    0o13: "bitb", 0o14: "bicb", 0o15: "bisb", 0o16: "sub"
+}
+BRANCH_NAMES = {  # word >> 8
+    0o001: "br", 0o002: "bne", 0o003: "beq", 0o004: "bge",
+    0o005: "blt", 0o006: "bgt", 0o007: "ble", 0o200: "bpl",
+    0o201: "bmi", 0o202: "bhi", 0o203: "blos", 0o204: "bvc",
+    0o205: "bvs", 0o206: "bcc", 0o207: "bcs"
+}
+SINGLE_OP_NAMES = {  # word >> 6
+    0o0050: "clr", 0o0051: "com", 0o0052: "inc", 0o0053: "dec",
+    0o0054: "neg", 0o0055: "adc", 0o0056: "sbc", 0o0057: "tst",
+    0o0060: "ror", 0o0061: "rol", 0o0062: "asr", 0o0063: "asl",
+    0o1050: "clrb", 0o1051: "comb", 0o1052: "incb", 0o1053: "decb",
+    0o1054: "negb", 0o1055: "adcb", 0o1056: "sbcb", 0o1057: "tstb",
+    0o1060: "rorb", 0o1061: "rolb", 0o1062: "asrb", 0o1063: "aslb"
+}
+SYS_NAMES = {  # trap number
+    1: "exit", 2: "fork", 3: "read", 4: "write", 5: "open",
+    6: "close", 7: "wait", 8: "creat", 9: "link", 10: "unlink",
+    11: "exec", 12: "chdir", 13: "time", 14: "mknod", 15: "chmod",
+    16: "chown", 17: "break", 18: "stat", 19: "seek", 20: "getpid"
+}
+
 @dataclass
 class Instruction:
     addr: int
@@ -97,54 +124,87 @@ class Instruction:
     operands: str
     comment: str = ""
 
-def decode_operand(mode: int, reg: int, data: bytes, offset: int) -> Tuple[str, int]:
-    """Decode a PDP-11 operand, return (string, bytes consumed)."""
-    extra = 0
-
-    if mode == 0:  # Register
-        return REGS[reg], 0
-    elif mode == 1:  # Register deferred
-        return f"({REGS[reg]})", 0
-    elif mode == 2:  # Autoincrement
-        if reg == 7:  # PC - immediate
-            if offset + 2 <= len(data):
-                val = struct.unpack_from("<H", data, offset)[0]
-                return f"${val:o}", 2
-            return "(pc)+", 0
-        return f"({REGS[reg]})+", 0
-    elif mode == 3:  # Autoincrement deferred
-        if reg == 7:  # PC - absolute
-            if offset + 2 <= len(data):
-                val = struct.unpack_from("<H", data, offset)[0]
-                return f"@${val:o}", 2
-        return f"@({REGS[reg]})+", 0
-    elif mode == 4:  # Autodecrement
-        return f"-({REGS[reg]})", 0
-    elif mode == 5:  # Autodecrement deferred
-        return f"@-({REGS[reg]})", 0
-    elif mode == 6:  # Index
-        if offset + 2 <= len(data):
-            disp = struct.unpack_from("<h", data, offset)[0]
-            if reg == 7:  # PC-relative
-                return f"{disp:o}(pc)", 2
-            return f"{disp:o}({REGS[reg]})", 2
-        return f"?({REGS[reg]})", 0
-    elif mode == 7:  # Index deferred
-        if offset + 2 <= len(data):
-            disp = struct.unpack_from("<h", data, offset)[0]
-            return f"@{disp:o}({REGS[reg]})", 2
-        return f"@?({REGS[reg]})", 0
-
-    return "?", 0
+# Operand strings for the register-only addressing modes, indexed by reg
+OP_DEFER = tuple(f"({r})" for r in REGS)
+OP_AUTOINC = tuple(f"({r})+" for r in REGS)
+OP_AUTOINC_DEFER = tuple(f"@({r})+" for r in REGS)
+OP_AUTODEC = tuple(f"-({r})" for r in REGS)
+OP_AUTODEC_DEFER = tuple(f"@-({r})" for r in REGS)
+
+# Addressing modes: one handler per mode, taking decode_operand's arguments
+# after the mode and returning the same tuple
+def _op_register(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    return REGS[reg], 0, None
+
+def _op_deferred(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    return OP_DEFER[reg], 0, None
+
+def _op_autoinc(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    if reg == 7:  # PC - immediate
+        if widx < len(words):
+            val = words[widx]
+            return f"${val:o}", 2, val
+        return "(pc)+", 0, None
+    return OP_AUTOINC[reg], 0, None
+
+def _op_autoinc_deferred(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    if reg == 7:  # PC - absolute
+        if widx < len(words):
+            val = words[widx]
+            return f"@${val:o}", 2, val
+    return OP_AUTOINC_DEFER[reg], 0, None
+
+def _op_autodec(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    return OP_AUTODEC[reg], 0, None
+
+def _op_autodec_deferred(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    return OP_AUTODEC_DEFER[reg], 0, None
+
+def _op_index(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    if widx < len(words):
+        val = words[widx]
+        disp = (val ^ 0x8000) - 0x8000  # signed
+        return f"{disp:o}({REGS[reg]})", 2, val  # pc gives PC-relative
+    return f"?({REGS[reg]})", 0, None
+
+def _op_index_deferred(reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    if widx < len(words):
+        val = words[widx]
+        disp = (val ^ 0x8000) - 0x8000
+        return f"@{disp:o}({REGS[reg]})", 2, val
+    return f"@?({REGS[reg]})", 0, None
+
+OPERAND_HANDLERS = (
+    _op_register, _op_deferred, _op_autoinc, _op_autoinc_deferred,
+    _op_autodec, _op_autodec_deferred, _op_index, _op_index_deferred
+)
+
+def decode_operand(mode: int, reg: int, words: memoryview, widx: int) -> Tuple[str, int, Optional[int]]:
+    """Decode a PDP-11 operand, return (string, bytes consumed, extension word).
+
+    widx indexes the operand's extension word in words; the returned word
+    is None when the operand does not use one.
+    """
+    return OPERAND_HANDLERS[mode](reg, words, widx)
+
+def word_views(data: bytes) -> memoryview:
+    """Return data as 16-bit words (PDP-11 is little-endian); a trailing odd byte is dropped."""
+    mv = memoryview(data)[:len(data) & ~1]
+    if sys.byteorder != "little":
+        swapped = array("H", mv.tobytes())
+        swapped.byteswap()
+        mv = memoryview(swapped).cast("B")
+    return mv.cast("H")
 
 def disassemble(data: bytes, base_addr: int = 0) -> List[Instruction]:
     """Disassemble PDP-11 binary."""
     instructions = []
+    words = word_views(data)
     offset = 0
 
-    while offset < len(data) - 1:
+    while offset >> 1 < len(words):
         addr = base_addr + offset
-        word = struct.unpack_from("<H", data, offset)[0]
+        word = words[offset >> 1]
         raw = [word]
         consumed = 2
 
@@ -153,50 +213,39 @@ def disassemble(data: bytes, base_addr: int = 0) -> List[Instruction]:
         comment = ""
 
         # Try to decode
-        opcode_high = (word >> 12) & 0o17
+        double = DOUBLE_OP_NAMES.get(word >> 12)
+        branch = BRANCH_NAMES.get(word >> 8)
+        single = SINGLE_OP_NAMES.get(word >> 6)
 
         # Double operand instructions
-        if opcode_high in [0o01, 0o02, 0o03, 0o04, 0o05, 0o06,
-                          0o11, 0o12, 0o13, 0o14, 0o15, 0o16]:
-            names = {0o01: "mov", 0o02: "cmp", 0o03: "bit", 0o04: "bic",
-                    0o05: "bis", 0o06: "add", 0o11: "movb", 0o12: "cmpb",
-                    0o13: "bitb", 0o14: "bicb", 0o15: "bisb", 0o16: "sub"}
-            mnemonic = names[opcode_high]
+        if double is not None:
+            mnemonic = double
 
             src_mode = (word >> 9) & 0o7
             src_reg = (word >> 6) & 0o7
             dst_mode = (word >> 3) & 0o7
             dst_reg = word & 0o7
 
-            src_str, src_extra = decode_operand(src_mode, src_reg, data, offset + consumed)
+            src_str, src_extra, src_word = decode_operand(src_mode, src_reg, words, (offset + consumed) >> 1)
             consumed += src_extra
-            if src_extra:
-                raw.append(struct.unpack_from("<H", data, offset + 2)[0])
+            if src_word is not None:
+                raw.append(src_word)
 
-            dst_str, dst_extra = decode_operand(dst_mode, dst_reg, data, offset + consumed)
+            dst_str, dst_extra, dst_word = decode_operand(dst_mode, dst_reg, words, (offset + consumed) >> 1)
             consumed += dst_extra
-            if dst_extra:
-                raw.append(struct.unpack_from("<H", data, offset + consumed - 2)[0])
+            if dst_word is not None:
+                raw.append(dst_word)
 
             operands = f"{src_str}, {dst_str}"
 
         # Branch instructions
-        elif (word >> 8) in [0o004, 0o010, 0o014, 0o020, 0o024, 0o030, 0o034,
-                            0o100, 0o104, 0o110, 0o114, 0o120, 0o124, 0o130, 0o134]:
-            branches = {
-                0o004: "br", 0o010: "bne", 0o014: "beq", 0o020: "bge",
-                0o024: "blt", 0o030: "bgt", 0o034: "ble", 0o100: "bpl",
-                0o104: "bmi", 0o110: "bhi", 0o114: "blos", 0o120: "bvc",
-                0o124: "bvs", 0o130: "bcc", 0o134: "bcs"
-            }
-            branch_op = word >> 8
-            if branch_op in branches:
-                mnemonic = branches[branch_op]
-                disp = word & 0o377
-                if disp & 0o200:
-                    disp = disp - 256
-                target = addr + 2 + (disp * 2)
-                operands = f"{target:o}"
+        elif branch is not None:
+            mnemonic = branch
+            disp = word & 0o377
+            if disp & 0o200:
+                disp = disp - 256
+            target = addr + 2 + (disp * 2)
+            operands = f"{target:o}"
 
         # JSR
         elif (word >> 9) == 0o004:
@@ -204,8 +253,10 @@ def disassemble(data: bytes, base_addr: int = 0) -> List[Instruction]:
             reg = (word >> 6) & 0o7
             dst_mode = (word >> 3) & 0o7
             dst_reg = word & 0o7
-            dst_str, dst_extra = decode_operand(dst_mode, dst_reg, data, offset + consumed)
+            dst_str, dst_extra, dst_word = decode_operand(dst_mode, dst_reg, words, (offset + consumed) >> 1)
             consumed += dst_extra
+            if dst_word is not None:
+                raw.append(dst_word)
             operands = f"{REGS[reg]}, {dst_str}"
 
         # RTS
@@ -214,42 +265,24 @@ def disassemble(data: bytes, base_addr: int = 0) -> List[Instruction]:
             operands = REGS[word & 0o7]
 
         # Single operand
-        elif (word >> 6) in [0o0050, 0o0051, 0o0052, 0o0053, 0o0054, 0o0055,
-                            0o0056, 0o0057, 0o0060, 0o0061, 0o0062, 0o0063,
-                            0o1050, 0o1051, 0o1052, 0o1053, 0o1054, 0o1055,
-                            0o1056, 0o1057, 0o1060, 0o1061, 0o1062, 0o1063]:
-            singles = {
-                0o0050: "clr", 0o0051: "com", 0o0052: "inc", 0o0053: "dec",
-                0o0054: "neg", 0o0055: "adc", 0o0056: "sbc", 0o0057: "tst",
-                0o0060: "ror", 0o0061: "rol", 0o0062: "asr", 0o0063: "asl",
-                0o1050: "clrb", 0o1051: "comb", 0o1052: "incb", 0o1053: "decb",
-                0o1054: "negb", 0o1055: "adcb", 0o1056: "sbcb", 0o1057: "tstb",
-                0o1060: "rorb", 0o1061: "rolb", 0o1062: "asrb", 0o1063: "aslb"
-            }
-            op = word >> 6
-            if op in singles:
-                mnemonic = singles[op]
-                dst_mode = (word >> 3) & 0o7
-                dst_reg = word & 0o7
-                dst_str, dst_extra = decode_operand(dst_mode, dst_reg, data, offset + consumed)
-                consumed += dst_extra
-                operands = dst_str
-
-        # TRAP/EMT/SYS
-        elif (word >> 8) == 0o104:
+        elif single is not None:
+            mnemonic = single
+            dst_mode = (word >> 3) & 0o7
+            dst_reg = word & 0o7
+            dst_str, dst_extra, dst_word = decode_operand(dst_mode, dst_reg, words, (offset + consumed) >> 1)
+            consumed += dst_extra
+            if dst_word is not None:
+                raw.append(dst_word)
+            operands = dst_str
+
+        # TRAP/SYS (104400-104777)
+        elif (word >> 8) == 0o211:
             trap_num = word & 0o377
+            mnemonic = "sys"
             if trap_num == 0:
-                mnemonic = "sys"
                 operands = "indir"
             else:
-                mnemonic = "sys"
-                sys_names = {
-                    1: "exit", 2: "fork", 3: "read", 4: "write", 5: "open",
-                    6: "close", 7: "wait", 8: "creat", 9: "link", 10: "unlink",
-                    11: "exec", 12: "chdir", 13: "time", 14: "mknod", 15: "chmod",
-                    16: "chown", 17: "break", 18: "stat", 19: "seek", 20: "getpid"
-                }
-                operands = sys_names.get(trap_num, str(trap_num))
+                operands = SYS_NAMES.get(trap_num, str(trap_num))
 
         # Halt/Wait/etc
         elif word == 0:
@@ -260,18 +293,21 @@ def disassemble(data: bytes, base_addr: int = 0) -> List[Instruction]:
 
     return instructions
 
+# Six-digit octal strings for the low addresses and small words that make
+# up most of a listing
+OCT6 = [f"{i:06o}" for i in range(1024)]
+
+def octal6(value: int) -> str:
+    """Format value as six octal digits."""
+    return OCT6[value] if value < 1024 else f"{value:06o}"
+
 def analyze_aout(filename: str):
     """Analyze a.out format binary."""
     with open(filename, "rb") as f:
         data = f.read()
 
     # Parse header
-    magic = struct.unpack_from("<H", data, 0)[0]
-    text_size = struct.unpack_from("<H", data, 2)[0]
-    data_size = struct.unpack_from("<H", data, 4)[0]
-    bss_size = struct.unpack_from("<H", data, 6)[0]
-    sym_size = struct.unpack_from("<H", data, 8)[0]
-    entry = struct.unpack_from("<H", data, 10)[0]
+    magic, text_size, data_size, bss_size, sym_size, entry = word_views(data)[:6]
 
     print(f"=== PDP-11 a.out Header ===")
     print(f"Magic:       {magic:06o} ({'OMAGIC' if magic == 0o407 else 'NMAGIC' if magic == 0o410 else 'unknown'})")
@@ -289,9 +325,10 @@ def analyze_aout(filename: str):
     print(f"=== Disassembly (first 100 instructions) ===")
     instructions = disassemble(text_data, 0)
 
-    for i, inst in enumerate(instructions[:100]):
-        raw_str = " ".join(f"{w:06o}" for w in inst.raw)
-        print(f"{inst.addr:06o}: {raw_str:20s} {inst.mnemonic:6s} {inst.operands}")
+    lines = [f"{octal6(inst.addr)}: {' '.join(map(octal6, inst.raw)):20s} "
+             f"{inst.mnemonic:6s} {inst.operands}"
+             for inst in instructions[:100]]
+    sys.stdout.write("\n".join(lines) + "\n" if lines else "")
 
     print(f"\n... ({len(instructions)} total instructions)")
 